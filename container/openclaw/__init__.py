@@ -9,7 +9,12 @@ This package provides:
 """
 
 from .agent import ArmorClawAgent, main
-from .bridge_client import BridgeClient, AsyncBridgeClient, get_default_client
+from .bridge_client import (
+    BridgeClient,
+    AsyncBridgeClient,
+    get_default_client,
+    get_default_async_client,
+)
 
 __version__ = "1.0.0-sc"
 
@@ -18,5 +23,6 @@ __all__ = [
     "BridgeClient",
     "AsyncBridgeClient",
     "get_default_client",
+    "get_default_async_client",
     "main",
 ]
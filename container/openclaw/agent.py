@@ -15,14 +15,15 @@ import asyncio
 import json
 import logging
 import re
+from dataclasses import dataclass
 from typing import Optional, Dict, Any, List, Tuple
 
 # ArmorClaw: Import bridge client for communication
 try:
-    from .bridge_client import AsyncBridgeClient, get_default_client
+    from .bridge_client import get_default_async_client
 except ImportError:
     # Fallback for direct execution
-    from bridge_client import AsyncBridgeClient, get_default_client
+    from bridge_client import get_default_async_client
 
 # Version info
 __version__ = "1.1.0-sk"  # Skills-enabled version
@@ -31,6 +32,51 @@ __version__ = "1.1.0-sk"  # Skills-enabled version
 logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
 logger = logging.getLogger(__name__)
 
+# Backoff bounds (seconds) between Matrix polls that returned no events
+MATRIX_POLL_MIN_SLEEP = 0.1
+MATRIX_POLL_MAX_SLEEP = 5.0
+
+# API key environment variables and the provider each one enables
+_PROVIDER_MAP = (
+    ("OPENAI_API_KEY", "OpenAI"),
+    ("ANTHROPIC_API_KEY", "Anthropic"),
+    ("OPENROUTER_API_KEY", "OpenRouter"),
+    ("GOOGLE_API_KEY", "Google"),
+    ("GEMINI_API_KEY", "Gemini"),
+    ("XAI_API_KEY", "xAI"),
+)
+
+
+@dataclass(frozen=True)
+class _StartupInfo:
+    """Startup-relevant environment, read once."""
+
+    providers: Tuple[str, ...]
+    bridge_socket: str
+    matrix_room: str
+
+
+def _scan_env() -> _StartupInfo:
+    """Read provider credentials presence (values are never read out) and paths."""
+    environ = os.environ
+    return _StartupInfo(
+        providers=tuple(
+            provider for env_var, provider in _PROVIDER_MAP if environ.get(env_var)
+        ),
+        bridge_socket=environ.get("ARMORCLAW_BRIDGE_SOCKET", "/run/armorclaw/bridge.sock"),
+        matrix_room=environ.get("ARMORCLAW_MATRIX_ROOM", ""),
+    )
+
+
+# Secrets are injected before the agent process starts, so one scan suffices
+_STARTUP_INFO = _scan_env()
+
+
+def _refresh() -> None:
+    """Rescan the environment after it has changed (tests)."""
+    global _STARTUP_INFO
+    _STARTUP_INFO = _scan_env()
+
 
 class ArmorClawAgent:
     """
@@ -53,47 +99,53 @@ class ArmorClawAgent:
         self.bridge_client = None
         self.matrix_room_id = os.getenv("ARMORCLAW_MATRIX_ROOM", "")
         self.running = False
+        self._stop: Optional[asyncio.Event] = None
+
+        # Command dispatch table for _handle_command
+        self._cmd_dispatch = {
+            "/status": self._cmd_status,
+            "/help": self._cmd_help,
+            "/ping": self._cmd_ping,
+            "/skills": self._cmd_skills,
+            "/attach_config": self._cmd_attach_config,
+        }
 
     async def initialize(self) -> None:
         """Initialize the bridge connection."""
-        logger.info(f"Connecting to ArmorClaw bridge at {self.bridge_socket}")
+        logger.info("Connecting to ArmorClaw bridge at %s", self.bridge_socket)
 
         try:
-            self.bridge_client = AsyncBridgeClient(self.bridge_socket)
+            self.bridge_client = get_default_async_client(self.bridge_socket)
 
             # Check bridge health
             health = await self.bridge_client.health()
-            logger.info(f"Bridge health: {health.get('status', 'unknown')}")
+            logger.info("Bridge health: %s", health.get("status", "unknown"))
 
             # Check Matrix status
             matrix_status = await self.bridge_client.matrix_status()
-            logger.info(f"Matrix enabled: {matrix_status.get('enabled', False)}")
+            logger.info("Matrix enabled: %s", matrix_status.get("enabled", False))
 
             if matrix_status.get("enabled") and self.matrix_room_id:
-                logger.info(f"Agent will monitor Matrix room: {self.matrix_room_id}")
+                logger.info("Agent will monitor Matrix room: %s", self.matrix_room_id)
 
         except Exception as e:
-            logger.error(f"Failed to initialize bridge connection: {e}")
+            logger.error("Failed to initialize bridge connection: %s", e)
             logger.info("Agent will continue in standalone mode for testing")
             self.bridge_client = None
 
-    async def process_matrix_message(self, event: Dict) -> Optional[str]:
+    async def process_matrix_message(self, body: str, sender: str) -> Optional[str]:
         """
-        Process a Matrix message event.
+        Process the body of a Matrix text message.
 
         Args:
-            event: Matrix event dictionary
+            body: Message body
+            sender: Message sender
 
         Returns:
             Response message (if applicable)
         """
-        # Extract message content
-        content = event.get("content", {})
-        body = content.get("body", "")
-        sender = event.get("sender", "")
-        msgtype = content.get("msgtype", "m.text")
-
-        logger.info(f"Received Matrix message from {sender}: {body[:100]}")
+        # %.100s truncates lazily, only if the record is actually emitted
+        logger.info("Received Matrix message from %s: %.100s", sender, body)
 
         # Process commands
         if body.startswith("/"):
@@ -113,21 +165,29 @@ class ArmorClawAgent:
         Returns:
             Command response (if applicable)
         """
-        parts = command.split()
+        # At most "<cmd> <arg> <rest>" is needed, so don't split the whole body
+        parts = command.split(None, 2)
         cmd = parts[0].lower()
 
-        if cmd == "/status":
-            status = {
-                "version": __version__,
-                "agent": "ArmorClaw OpenClaw",
-                "container": os.getenv("HOSTNAME", "unknown"),
-                "bridge_connected": self.bridge_client is not None,
-                "matrix_enabled": self.matrix_room_id != "",
-            }
-            return json.dumps(status, indent=2)
+        handler = self._cmd_dispatch.get(cmd)
+        if handler is None:
+            return f"Unknown command: {cmd}. Try /help"
+        return await handler(parts, sender)
+
+    async def _cmd_status(self, parts: List[str], sender: str) -> Optional[str]:
+        """Handle /status."""
+        status = {
+            "version": __version__,
+            "agent": "ArmorClaw OpenClaw",
+            "container": os.getenv("HOSTNAME", "unknown"),
+            "bridge_connected": self.bridge_client is not None,
+            "matrix_enabled": self.matrix_room_id != "",
+        }
+        return json.dumps(status)
 
-        elif cmd == "/help":
-            help_text = """
+    async def _cmd_help(self, parts: List[str], sender: str) -> Optional[str]:
+        """Handle /help."""
+        help_text = """
 **ArmorClaw OpenClaw Agent Commands**
 
 /status - Show agent status
@@ -147,62 +207,61 @@ For agent requests, just send your message directly.
 /attach_config agent.env MODEL=gpt-4
 /attach_config config.toml [agent]\\nmodel=gpt-4
 """
-            return help_text.strip()
-
-        elif cmd == "/ping":
-            return "🏓 Pong! ArmorClaw agent is running."
+        return help_text.strip()
 
-        elif cmd == "/skills":
-            if not self.bridge_client:
-                return "⚠️ Bridge not connected. Cannot list skills."
+    async def _cmd_ping(self, parts: List[str], sender: str) -> Optional[str]:
+        """Handle /ping."""
+        return "🏓 Pong! ArmorClaw agent is running."
 
-            try:
-                skills_result = await self.bridge_client.skills_list()
-                skills = skills_result.get("skills", [])
-                count = skills_result.get("count", 0)
+    async def _cmd_skills(self, parts: List[str], sender: str) -> Optional[str]:
+        """Handle /skills."""
+        if not self.bridge_client:
+            return "⚠️ Bridge not connected. Cannot list skills."
 
-                if count == 0:
-                    return "No skills available."
+        try:
+            skills_result = await self.bridge_client.skills_list()
+            skills = skills_result.get("skills", [])
+            count = skills_result.get("count", 0)
 
-                # Format skills output
-                response = f"**Available Skills ({count}):**\n\n"
-                for skill in skills[:10]:  # Limit to first 10 for readability
-                    name = skill.get("name", "Unknown")
-                    domain = skill.get("domain", "general")
-                    description = skill.get("description", "No description")
-                    response += f"• **{name}** ({domain})\n  {description}\n"
+            if count == 0:
+                return "No skills available."
 
-                if count > 10:
-                    response += f"\n... and {count - 10} more skills."
+            # Format skills output
+            response = f"**Available Skills ({count}):**\n\n"
+            for skill in skills[:10]:  # Limit to first 10 for readability
+                name = skill.get("name", "Unknown")
+                domain = skill.get("domain", "general")
+                description = skill.get("description", "No description")
+                response += f"• **{name}** ({domain})\n  {description}\n"
 
-                return response
-            except Exception as e:
-                return f"❌ Failed to list skills: {e}"
+            if count > 10:
+                response += f"\n... and {count - 10} more skills."
 
-        elif cmd == "/attach_config":
-            # Usage: /attach_config <name> <content>
-            if len(parts) < 3:
-                return "Usage: /attach_config <name> <content>\nExample: /attach_config agent.env MODEL=gpt-4"
+            return response
+        except Exception as e:
+            return f"❌ Failed to list skills: {e}"
 
-            config_name = parts[1]
-            config_content = " ".join(parts[2:])
+    async def _cmd_attach_config(self, parts: List[str], sender: str) -> Optional[str]:
+        """Handle /attach_config <name> <content>."""
+        if len(parts) < 3:
+            return "Usage: /attach_config <name> <content>\nExample: /attach_config agent.env MODEL=gpt-4"
 
-            if not self.bridge_client:
-                return "⚠️ Bridge not connected. Cannot attach config."
+        # parts[2] is the remainder of the message with its whitespace intact
+        _, config_name, config_content = parts
 
-            try:
-                result = self.bridge_client.attach_config(
-                    name=config_name,
-                    content=config_content,
-                    encoding="raw",
-                    config_type="env",
-                )
-                return f"✅ Config attached:\n{json.dumps(result, indent=2)}"
-            except Exception as e:
-                return f"❌ Failed to attach config: {e}"
+        if not self.bridge_client:
+            return "⚠️ Bridge not connected. Cannot attach config."
 
-        else:
-            return f"Unknown command: {cmd}. Try /help"
+        try:
+            result = await self.bridge_client.attach_config(
+                name=config_name,
+                content=config_content,
+                encoding="raw",
+                config_type="env",
+            )
+            return f"✅ Config attached:\n{json.dumps(result, indent=2)}"
+        except Exception as e:
+            return f"❌ Failed to attach config: {e}"
 
     async def _process_agent_request(self, request: str, sender: str) -> Optional[str]:
         """
@@ -217,7 +276,7 @@ For agent requests, just send your message directly.
         Returns:
             Agent response
         """
-        logger.info(f"Processing agent request from {sender}")
+        logger.info("Processing agent request from %s", sender)
 
         # Build messages for AI
         system_message = {
@@ -238,7 +297,7 @@ For agent requests, just send your message directly.
                 return "Agent running in standalone mode without bridge connection."
 
         except Exception as e:
-            logger.error(f"AI chat error: {e}")
+            logger.error("AI chat error: %s", e)
             return f"Sorry, I encountered an error processing your request: {e}"
 
     async def _process_agent_request_with_react(
@@ -324,7 +383,7 @@ For agent requests, just send your message directly.
                 return reasoning
 
         except Exception as e:
-            logger.error(f"ReAct loop error: {e}")
+            logger.error("ReAct loop error: %s", e)
             # Fallback to simple AI chat
             return await self._process_agent_request(request, sender)
 
@@ -409,7 +468,7 @@ Ready to help! What would you like me to assist you with?
                 params = json.loads(params_str)
                 return {"skill_name": skill_name, "params": params}
             except json.JSONDecodeError:
-                logger.warning(f"Invalid JSON in skill parameters: {params_str}")
+                logger.warning("Invalid JSON in skill parameters: %s", params_str)
                 return None
 
         return None
@@ -427,14 +486,14 @@ Ready to help! What would you like me to assist you with?
         skill_name = skill_execution["skill_name"]
         params = skill_execution["params"]
 
-        logger.info(f"Executing skill: {skill_name} with params: {params}")
+        logger.info("Executing skill: %s with params: %s", skill_name, params)
 
         try:
             result = await self.bridge_client.skills_execute(skill_name, params)
-            logger.info(f"Skill execution result: {result}")
+            logger.info("Skill execution result: %s", result)
             return result
         except Exception as e:
-            logger.error(f"Skill execution error: {e}")
+            logger.error("Skill execution error: %s", e)
             return {"success": False, "error": str(e), "type": "error"}
 
     async def run_matrix_loop(self) -> None:
@@ -450,8 +509,9 @@ Ready to help! What would you like me to assist you with?
             logger.info("Matrix loop not available - running in standalone mode")
             return
 
-        logger.info(f"Starting Matrix message loop for room: {self.matrix_room_id}")
+        logger.info("Starting Matrix message loop for room: %s", self.matrix_room_id)
         cursor = ""
+        idle_sleep = MATRIX_POLL_MIN_SLEEP
 
         while self.running:
             try:
@@ -468,13 +528,15 @@ Ready to help! What would you like me to assist you with?
                 count = result.get("count", 0)
 
                 if count > 0:
-                    logger.info(f"Received {count} Matrix event(s)")
+                    logger.info("Received %d Matrix event(s)", count)
 
                     for event in events:
                         # Only process text messages
                         content = event.get("content", {})
                         if content.get("msgtype") == "m.text":
-                            response = await self.process_matrix_message(event)
+                            response = await self.process_matrix_message(
+                                content.get("body", ""), event.get("sender", "")
+                            )
 
                             if response:
                                 # Send response back through Matrix
@@ -483,11 +545,19 @@ Ready to help! What would you like me to assist you with?
                                 )
                                 logger.info("Response sent to Matrix")
 
-                # Wait briefly before polling again
-                await asyncio.sleep(0.1)
+                # The bridge already long-polls, so poll again immediately
+                # while events are flowing. Only back off on empty results,
+                # which guards against a bridge that returns without waiting.
+                if count > 0:
+                    idle_sleep = MATRIX_POLL_MIN_SLEEP
+                    continue
+
+                await asyncio.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, MATRIX_POLL_MAX_SLEEP)
 
             except Exception as e:
-                logger.error(f"Error in Matrix loop: {e}")
+                logger.error("Error in Matrix loop: %s", e)
+                idle_sleep = MATRIX_POLL_MIN_SLEEP
                 await asyncio.sleep(5)
 
     async def run_agent_loop(self) -> None:
@@ -500,6 +570,8 @@ Ready to help! What would you like me to assist you with?
         logger.info("Press Ctrl+C to stop")
 
         self.running = True
+        if self._stop is None:
+            self._stop = asyncio.Event()
 
         try:
             # Start Matrix communication if configured
@@ -507,9 +579,8 @@ Ready to help! What would you like me to assist you with?
             if self.bridge_client and self.matrix_room_id:
                 matrix_task = asyncio.create_task(self.run_matrix_loop())
 
-            # Keep agent alive
-            while self.running:
-                await asyncio.sleep(60)
+            # Keep agent alive until stop() is called
+            await self._stop.wait()
 
             # Cancel Matrix task if running
             if matrix_task:
@@ -524,6 +595,35 @@ Ready to help! What would you like me to assist you with?
 
         finally:
             self.running = False
+            self._stop = None
+
+    def stop(self) -> None:
+        """Request a graceful shutdown of the agent loop."""
+        self.running = False
+        if self._stop is not None:
+            self._stop.set()
+
+    def _handle_signal(self, signum: int) -> None:
+        """Handle shutdown signals gracefully."""
+        logger.info("Received signal %s, shutting down...", signum)
+        self.stop()
+
+    async def _main(self) -> None:
+        """Initialize and run the agent on a single event loop."""
+        self._stop = asyncio.Event()
+
+        # Set up signal handlers on the running loop so shutdown wakes the
+        # agent loop immediately
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(signum, self._handle_signal, signum)
+            except (NotImplementedError, RuntimeError):
+                # Not supported on this platform or outside the main thread
+                pass
+
+        await self.initialize()
+        await self.run_agent_loop()
 
     def start(self) -> None:
         """
@@ -531,24 +631,13 @@ Ready to help! What would you like me to assist you with?
 
         This method runs the async agent loop and handles signals.
         """
-
-        def signal_handler(signum, frame):
-            """Handle shutdown signals gracefully."""
-            logger.info(f"Received signal {signum}, shutting down...")
-            self.running = False
-
-        # Set up signal handlers
-        signal.signal(signal.SIGTERM, signal_handler)
-        signal.signal(signal.SIGINT, signal_handler)
-
         # Run the async agent loop
         try:
-            asyncio.run(self.initialize())
-            asyncio.run(self.run_agent_loop())
+            asyncio.run(self._main())
         except KeyboardInterrupt:
             logger.info("Agent stopped by user")
         except Exception as e:
-            logger.error(f"Agent error: {e}")
+            logger.error("Agent error: %s", e)
             sys.exit(1)
 
 
@@ -557,6 +646,19 @@ Ready to help! What would you like me to assist you with?
 # ============================================================================
 
 
+# Tools that must not be present in the hardened container
+_DANGEROUS_TOOLS = (
+    "/bin/sh",
+    "/bin/bash",
+    "/bin/rm",
+    "/usr/bin/mv",
+    "/usr/bin/find",
+    "/usr/bin/curl",
+    "/usr/bin/wget",
+    "/usr/bin/nc",
+)
+
+
 def verify_environment() -> bool:
     """
     Verify the container environment is properly secured.
@@ -567,56 +669,30 @@ def verify_environment() -> bool:
 
     # Check running as claw user (UID 10001)
     if uid != 10001:
-        logger.warning(f"Not running as UID 10001 (current: {uid})")
+        logger.warning("Not running as UID 10001 (current: %d)", uid)
 
     # Check for dangerous tools (should not exist)
-    dangerous_paths = [
-        "/bin/sh",
-        "/bin/bash",
-        "/bin/rm",
-        "/usr/bin/mv",
-        "/usr/bin/find",
-        "/usr/bin/curl",
-        "/usr/bin/wget",
-        "/usr/bin/nc",
-    ]
-
-    for path in dangerous_paths:
+    for path in _DANGEROUS_TOOLS:
         if os.path.exists(path):
-            logger.warning(f"Dangerous tool exists: {path}")
+            logger.warning("Dangerous tool exists: %s", path)
 
     return True
 
 
 def log_startup() -> None:
     """Log agent startup without exposing secrets."""
-    # Count how many API keys are present (values hidden)
-    key_count = 0
-    providers = []
-
-    provider_map = {
-        "OPENAI_API_KEY": "OpenAI",
-        "ANTHROPIC_API_KEY": "Anthropic",
-        "OPENROUTER_API_KEY": "OpenRouter",
-        "GOOGLE_API_KEY": "Google",
-        "GEMINI_API_KEY": "Gemini",
-        "XAI_API_KEY": "xAI",
-    }
-
-    for env_var, provider in provider_map.items():
-        if os.getenv(env_var):
-            key_count += 1
-            providers.append(provider)
+    info = _STARTUP_INFO
 
+    # Count how many API keys are present (values hidden)
     logger.info(
-        f"Agent starting with {key_count} configured provider(s): {', '.join(providers) if providers else 'None'}"
-    )
-    logger.info(f"Version: {__version__}")
-    logger.info(f"Containment: ArmorClaw v1 hardened container")
-    logger.info(
-        f"Bridge socket: {os.getenv('ARMORCLAW_BRIDGE_SOCKET', '/run/armorclaw/bridge.sock')}"
+        "Agent starting with %d configured provider(s): %s",
+        len(info.providers),
+        ", ".join(info.providers) if info.providers else "None",
     )
-    logger.info(f"Matrix room: {os.getenv('ARMORCLAW_MATRIX_ROOM', 'Not configured')}")
+    logger.info("Version: %s", __version__)
+    logger.info("Containment: ArmorClaw v1 hardened container")
+    logger.info("Bridge socket: %s", info.bridge_socket)
+    logger.info("Matrix room: %s", info.matrix_room or "Not configured")
 
 
 def verify_credentials() -> bool:
@@ -630,23 +706,7 @@ def verify_credentials() -> bool:
     Returns:
         bool: True if credentials are present, False otherwise
     """
-    provider_map = {
-        "OPENAI_API_KEY": "OpenAI",
-        "ANTHROPIC_API_KEY": "Anthropic",
-        "OPENROUTER_API_KEY": "OpenRouter",
-        "GOOGLE_API_KEY": "Google",
-        "GEMINI_API_KEY": "Gemini",
-        "XAI_API_KEY": "xAI",
-    }
-
-    has_credentials = False
-    missing_providers = []
-
-    for env_var, provider in provider_map.items():
-        if os.getenv(env_var):
-            has_credentials = True
-        else:
-            missing_providers.append(provider)
+    has_credentials = bool(_STARTUP_INFO.providers)
 
     if not has_credentials:
         logger.error("=" * 60)
@@ -10,9 +10,88 @@ import os
 import socket
 import json
 import asyncio
+import base64
+import functools
+import itertools
 from typing import Any, Dict, Optional, List
 from pathlib import Path
 
+# orjson is optional: it encodes straight to bytes and parses bytes without
+# an intermediate str, which is all the JSON-RPC framing needs.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj: Any) -> bytes:
+        # Match orjson's output: compact separators, UTF-8 rather than \u escapes
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=None)
+def _request_template(method: str) -> bytes:
+    """Pre-encoded frame for a parameterless request; ``%d`` is the id."""
+    method_json = _dumps(method).replace(b"%", b"%%")
+    return b'{"jsonrpc":"2.0","id":%d,"method":' + method_json + b"}\n"
+
+
+def _encode_request(request_id: int, method: str, params: Optional[Dict]) -> bytes:
+    """Encode a newline-terminated JSON-RPC 2.0 request frame."""
+    if params is None:
+        # Polled status calls carry no params; only the id changes
+        return _request_template(method) % request_id
+
+    request = {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+    return _dumps(request) + b"\n"
+
+
+# Initial size of the receive buffer for bridge responses
+RECV_BUFFER_SIZE = 65536
+
+# Default per-RPC socket timeout in seconds
+DEFAULT_TIMEOUT = 10.0
+
+# AI provider calls are slow; allow them this many seconds
+AI_CHAT_TIMEOUT = 60.0
+
+# Raw attach_config content longer than this is sent base64-encoded
+ATTACH_CONFIG_BASE64_THRESHOLD = 8192
+
+
+def _attach_config_params(
+    name: str,
+    content: str,
+    encoding: str,
+    config_type: str,
+    metadata: Optional[Dict[str, str]],
+) -> Dict[str, Any]:
+    """Build attach_config params, promoting large raw content to base64.
+
+    Base64 text needs no JSON escaping, so large configs are cheaper to
+    encode and for the bridge to parse; the bridge decodes either encoding.
+    """
+    if encoding == "raw" and len(content) > ATTACH_CONFIG_BASE64_THRESHOLD:
+        content = base64.b64encode(content.encode("utf-8")).decode("ascii")
+        encoding = "base64"
+
+    params = {
+        "name": name,
+        "content": content,
+        "encoding": encoding,
+    }
+
+    if config_type:
+        params["type"] = config_type
+
+    if metadata:
+        params["metadata"] = metadata
+
+    return params
+
 
 class BridgeClient:
     """
@@ -23,68 +102,99 @@ class BridgeClient:
     - Socket connection management
     - JSON-RPC request/response formatting
     - Event reception from Matrix
+
+    The bridge answers exactly one request per connection and closes the
+    socket after writing the response, so each RPC uses a fresh connection.
     """
 
-    def __init__(self, socket_path: str = "/run/armorclaw/bridge.sock"):
+    def __init__(
+        self,
+        socket_path: str = "/run/armorclaw/bridge.sock",
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
         """
         Initialize the bridge client.
 
         Args:
             socket_path: Path to the bridge Unix socket
+            timeout: Seconds to wait on any socket operation before giving up
         """
         self.socket_path = socket_path
-        self._request_id = 0
+        self.timeout = timeout
+        self._request_ids = itertools.count(1)
 
     def _get_next_id(self) -> int:
         """Get the next request ID."""
-        self._request_id += 1
-        return self._request_id
+        return next(self._request_ids)
 
-    def _send_request(self, method: str, params: Optional[Dict] = None) -> Dict:
+    def _connect(self, timeout: float) -> socket.socket:
+        """Open a connection to the bridge socket, closing it on failure."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(self.socket_path)
+        except BaseException:
+            sock.close()
+            raise
+        return sock
+
+    @staticmethod
+    def _recv_response(sock: socket.socket) -> bytearray:
+        """
+        Read a complete response frame from a bridge connection.
+
+        The bridge writes a single (pretty-printed, multi-line) response per
+        connection and then closes it, so EOF is the frame boundary. Data is
+        received directly into a preallocated buffer that doubles when full.
+        """
+        buf = bytearray(RECV_BUFFER_SIZE)
+        view = memoryview(buf)
+        length = 0
+        while True:
+            if length == len(buf):
+                view.release()
+                buf.extend(bytes(len(buf)))
+                view = memoryview(buf)
+            received = sock.recv_into(view[length:])
+            if not received:
+                break
+            length += received
+        view.release()
+        del buf[length:]
+        return buf
+
+    def _send_request(
+        self, method: str, params: Optional[Dict] = None, timeout: Optional[float] = None
+    ) -> Dict:
         """
         Send a JSON-RPC request to the bridge.
 
         Args:
             method: RPC method name
             params: Method parameters (optional)
+            timeout: Socket timeout for this call (optional, defaults to self.timeout)
 
         Returns:
             Response dictionary
 
         Raises:
-            ConnectionError: If unable to connect to bridge
+            ConnectionError: If unable to connect to bridge or the call times out
             RuntimeError: If RPC call fails
         """
-        request = {"jsonrpc": "2.0", "id": self._get_next_id(), "method": method}
-
-        if params is not None:
-            request["params"] = params
+        request = _encode_request(self._get_next_id(), method, params)
+        if timeout is None:
+            timeout = self.timeout
 
         # Connect to bridge socket
         try:
-            sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-            sock.connect(self.socket_path)
+            with self._connect(timeout) as sock:
+                # Send request
+                sock.sendall(request)
 
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            sock.sendall(request_json.encode("utf-8"))
-
-            # Receive response
-            response_data = b""
-            while True:
-                chunk = sock.recv(4096)
-                if not chunk:
-                    break
-                response_data += chunk
-                # Try to parse complete JSON
-                try:
-                    response = json.loads(response_data.decode("utf-8"))
-                    break
-                except json.JSONDecodeError:
-                    # Need more data
-                    continue
+                # Receive response
+                response_data = self._recv_response(sock)
 
-            sock.close()
+            response = _loads(response_data)
 
         except FileNotFoundError:
             raise ConnectionError(
@@ -96,6 +206,8 @@ class BridgeClient:
                 f"Connection refused to {self.socket_path}. "
                 f"Is the ArmorClaw bridge running?"
             )
+        except socket.timeout:
+            raise ConnectionError("Bridge RPC timed out after %.1fs" % timeout)
         except Exception as e:
             raise ConnectionError(f"Failed to connect to bridge: {e}")
 
@@ -253,7 +365,10 @@ class BridgeClient:
             Receive result with keys: events, count, cursor, cursor_reset
         """
         params = {"cursor": cursor, "timeout_ms": timeout_ms}
-        return self._send_request("matrix.receive", params)
+        # The bridge holds the call open for up to timeout_ms
+        return self._send_request(
+            "matrix.receive", params, timeout=self.timeout + timeout_ms / 1000
+        )
 
     # ========================================================================
     # Config Methods
@@ -276,7 +391,9 @@ class BridgeClient:
         Args:
             name: Config filename (e.g., "agent.env", "config.toml")
             content: File content (base64 or raw string)
-            encoding: Content encoding ("base64" or "raw", default: "raw")
+            encoding: Content encoding ("base64" or "raw", default: "raw").
+                Raw content over ATTACH_CONFIG_BASE64_THRESHOLD characters
+                is sent base64-encoded.
             config_type: Config type hint ("env", "toml", "yaml", "json", etc.)
             metadata: Additional metadata key-value pairs
 
@@ -302,18 +419,7 @@ class BridgeClient:
                 config_type="env"
             )
         """
-        params = {
-            "name": name,
-            "content": content,
-            "encoding": encoding,
-        }
-
-        if config_type:
-            params["type"] = config_type
-
-        if metadata:
-            params["metadata"] = metadata
-
+        params = _attach_config_params(name, content, encoding, config_type, metadata)
         return self._send_request("attach_config", params)
 
     def ai_chat(
@@ -368,7 +474,7 @@ class BridgeClient:
         if key_id:
             params["key_id"] = key_id
 
-        return self._send_request("ai.chat", params)
+        return self._send_request("ai.chat", params, timeout=AI_CHAT_TIMEOUT)
 
 
 # ============================================================================
@@ -382,68 +488,74 @@ class AsyncBridgeClient:
 
     This provides the same functionality as BridgeClient but with
     async methods for use in async agent loops.
+
+    Every RPC runs on its own connection (the bridge serves one request per
+    connection), so concurrent calls from separate tasks overlap freely: a
+    matrix_send is never queued behind a pending matrix_receive long-poll.
     """
 
-    def __init__(self, socket_path: str = "/run/armorclaw/bridge.sock"):
+    def __init__(
+        self,
+        socket_path: str = "/run/armorclaw/bridge.sock",
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
         """
         Initialize the async bridge client.
 
         Args:
             socket_path: Path to the bridge Unix socket
+            timeout: Seconds to wait on any socket operation before giving up
         """
         self.socket_path = socket_path
-        self._request_id = 0
+        self.timeout = timeout
+        self._request_ids = itertools.count(1)
 
     def _get_next_id(self) -> int:
         """Get the next request ID."""
-        self._request_id += 1
-        return self._request_id
+        return next(self._request_ids)
 
-    async def _send_request(self, method: str, params: Optional[Dict] = None) -> Dict:
+    async def _send_request(
+        self, method: str, params: Optional[Dict] = None, timeout: Optional[float] = None
+    ) -> Dict:
         """
         Send an async JSON-RPC request to the bridge.
 
         Args:
             method: RPC method name
             params: Method parameters (optional)
+            timeout: Read timeout for this call (optional, defaults to self.timeout)
 
         Returns:
             Response dictionary
-        """
-        request = {"jsonrpc": "2.0", "id": self._get_next_id(), "method": method}
 
-        if params is not None:
-            request["params"] = params
+        Raises:
+            ConnectionError: If unable to connect to bridge or the call times out
+            RuntimeError: If RPC call fails
+        """
+        request = _encode_request(self._get_next_id(), method, params)
+        if timeout is None:
+            timeout = self.timeout
 
         # Connect to bridge socket
         try:
             reader, writer = await asyncio.open_unix_connection(self.socket_path)
-
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            writer.write(request_json.encode("utf-8"))
-            await writer.drain()
-
-            # Receive response
-            response_data = b""
-            while True:
+            try:
+                # Send request
+                writer.write(request)
+                await writer.drain()
+
+                # Receive response. The bridge closes the connection after its
+                # single (multi-line) response, so read to EOF in one call and
+                # parse exactly once.
                 try:
-                    chunk = await asyncio.wait_for(reader.read(4096), timeout=5.0)
-                    if not chunk:
-                        break
-                    response_data += chunk
-                    # Try to parse complete JSON
-                    try:
-                        response = json.loads(response_data.decode("utf-8"))
-                        break
-                    except json.JSONDecodeError:
-                        # Need more data
-                        continue
+                    response_data = await asyncio.wait_for(reader.read(), timeout=timeout)
                 except asyncio.TimeoutError:
-                    break
+                    raise ConnectionError("Bridge RPC timed out after %.1fs" % timeout)
+            finally:
+                # The bridge has already hung up; nothing to wait for
+                writer.close()
 
-            writer.close()
-            await writer.wait_closed()
+            response = _loads(response_data)
 
         except FileNotFoundError:
             raise ConnectionError(
@@ -455,6 +567,8 @@ class AsyncBridgeClient:
                 f"Connection refused to {self.socket_path}. "
                 f"Is the ArmorClaw bridge running?"
             )
+        except ValueError as e:
+            raise ConnectionError(f"Invalid response from bridge: {e}")
 
         # Check for RPC error
         if "error" in response:
@@ -523,7 +637,10 @@ class AsyncBridgeClient:
             Receive result with keys: events, count, cursor, cursor_reset
         """
         params = {"cursor": cursor, "timeout_ms": timeout_ms}
-        return await self._send_request("matrix.receive", params)
+        # The bridge holds the call open for up to timeout_ms
+        return await self._send_request(
+            "matrix.receive", params, timeout=self.timeout + timeout_ms / 1000
+        )
 
     # ========================================================================
     # Async Config Methods
@@ -546,25 +663,16 @@ class AsyncBridgeClient:
         Args:
             name: Config filename (e.g., "agent.env", "config.toml")
             content: File content (base64 or raw string)
-            encoding: Content encoding ("base64" or "raw", default: "raw")
+            encoding: Content encoding ("base64" or "raw", default: "raw").
+                Raw content over ATTACH_CONFIG_BASE64_THRESHOLD characters
+                is sent base64-encoded.
             config_type: Config type hint ("env", "toml", "yaml", "json", etc.)
             metadata: Additional metadata key-value pairs
 
         Returns:
             Attach result with keys: config_id, name, path, size, type, encoding
         """
-        params = {
-            "name": name,
-            "content": content,
-            "encoding": encoding,
-        }
-
-        if config_type:
-            params["type"] = config_type
-
-        if metadata:
-            params["metadata"] = metadata
-
+        params = _attach_config_params(name, content, encoding, config_type, metadata)
         return await self._send_request("attach_config", params)
 
     async def ai_chat(
@@ -620,7 +728,10 @@ class AsyncBridgeClient:
         if key_id:
             params["key_id"] = key_id
 
-        return await asyncio.wait_for(self._send_request("ai.chat", params), timeout=60)
+        return await asyncio.wait_for(
+            self._send_request("ai.chat", params, timeout=AI_CHAT_TIMEOUT),
+            timeout=AI_CHAT_TIMEOUT,
+        )
 
     # ========================================================================
     # Async Skills Methods
@@ -1027,15 +1138,49 @@ class AsyncBridgeClient:
 # ============================================================================
 
 
-def get_default_client() -> BridgeClient:
+# Shared clients, keyed by socket path
+_default_clients: Dict[str, BridgeClient] = {}
+_default_async_clients: Dict[str, AsyncBridgeClient] = {}
+
+
+def _default_socket_path() -> str:
+    return os.getenv("ARMORCLAW_BRIDGE_SOCKET", "/run/armorclaw/bridge.sock")
+
+
+def get_default_client(socket_path: Optional[str] = None) -> BridgeClient:
     """
-    Get a bridge client with the default socket path.
+    Get the shared bridge client for the default socket path.
 
     The socket path can be overridden via environment variable:
     ARMORCLAW_BRIDGE_SOCKET
 
+    Args:
+        socket_path: Explicit socket path (optional, overrides the environment)
+
+    Returns:
+        BridgeClient instance, reused across calls for the same socket path
+    """
+    socket_path = socket_path or _default_socket_path()
+    client = _default_clients.get(socket_path)
+    if client is None:
+        client = _default_clients[socket_path] = BridgeClient(socket_path)
+    return client
+
+
+def get_default_async_client(socket_path: Optional[str] = None) -> AsyncBridgeClient:
+    """
+    Get the shared async bridge client for the default socket path.
+
+    Sharing one instance keeps request IDs unique across all async callers.
+
+    Args:
+        socket_path: Explicit socket path (optional, overrides the environment)
+
     Returns:
-        BridgeClient instance
+        AsyncBridgeClient instance, reused across calls for the same socket path
     """
-    socket_path = os.getenv("ARMORCLAW_BRIDGE_SOCKET", "/run/armorclaw/bridge.sock")
-    return BridgeClient(socket_path)
+    socket_path = socket_path or _default_socket_path()
+    client = _default_async_clients.get(socket_path)
+    if client is None:
+        client = _default_async_clients[socket_path] = AsyncBridgeClient(socket_path)
+    return client
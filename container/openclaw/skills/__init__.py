@@ -9,15 +9,13 @@ from .ssl_tunnel_setup import (
     list_ssl_skills,
     setup_ssl_tunnel,
     get_ssl_status,
+    get_ssl_status_async,
     NgrokTunnelSkill,
     CloudflareTunnelSkill,
     SelfSignedCertSkill
 )
 
-from .ssl_skill_handler import (
-    SSL_SETUP_INSTRUCTIONS,
-    DEFAULT_SKILLS
-)
+# SSL_SETUP_INSTRUCTIONS and DEFAULT_SKILLS are resolved lazily, see __getattr__
 
 __all__ = [
     # SSL Skills
@@ -25,6 +23,7 @@ __all__ = [
     'list_ssl_skills',
     'setup_ssl_tunnel',
     'get_ssl_status',
+    'get_ssl_status_async',
     'NgrokTunnelSkill',
     'CloudflareTunnelSkill',
     'SelfSignedCertSkill',
@@ -33,3 +32,10 @@ __all__ = [
     'SSL_SETUP_INSTRUCTIONS',
     'DEFAULT_SKILLS',
 ]
+
+
+def __getattr__(name):
+    if name in ("SSL_SETUP_INSTRUCTIONS", "DEFAULT_SKILLS"):
+        from . import ssl_skill_handler
+        return getattr(ssl_skill_handler, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
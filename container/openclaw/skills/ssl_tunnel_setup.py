@@ -9,10 +9,53 @@ Provides skills for setting up secure external access:
 These skills are invoked by the agent when user wants external access.
 """
 
+import asyncio
 import json
 import subprocess
 import os
-from typing import Optional, Dict, Any
+import re
+import selectors
+import shutil
+import time
+import urllib.request
+from collections.abc import Mapping
+from typing import Optional, Dict, Any, List, Tuple
+
+# ngrok's local agent API, served while a tunnel is running
+NGROK_API_URL = "http://localhost:4040/api/tunnels"
+
+# How long to wait for cloudflared to print its quick-tunnel URL
+CLOUDFLARE_URL_TIMEOUT = 30.0
+
+# How long to wait for a freshly started ngrok to report its public URL
+NGROK_STARTUP_TIMEOUT = 5.0
+NGROK_POLL_INTERVAL = 0.1
+
+# Where SelfSignedCertSkill writes its certificate by default
+SELF_SIGNED_CERT_PATH = "/etc/armorclaw/ssl/cert.pem"
+
+# Quick-tunnel URL as printed in cloudflared's (byte) output
+_CF_URL_RE = re.compile(rb'https://[^\s]+\.trycloudflare\.com')
+
+
+def _run_commands(commands: List[Tuple[List[str], Optional[bytes]]]) -> Optional[str]:
+    """
+    Run commands in order without a shell, stopping at the first failure
+
+    Each entry is (argv, stdin) where stdin is bytes to feed the command
+    or None. Returns the failing command's stderr (or the OS error if it
+    could not be started, e.g. not on PATH), or None on success.
+    """
+    for argv, stdin in commands:
+        try:
+            result = subprocess.run(
+                argv, input=stdin, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+        except OSError as e:
+            return str(e)
+        if result.returncode != 0:
+            return result.stderr.decode("utf-8", "replace")
+    return None
 
 
 class SSLTunnelSkill:
@@ -21,6 +64,17 @@ class SSLTunnelSkill:
     name = "ssl_tunnel"
     description = "Set up secure external access to ArmorClaw"
 
+    __slots__ = ("_available",)
+
+    def __init__(self):
+        self._available: Optional[bool] = None
+
+    def _has_binary(self, name: str) -> bool:
+        """Look up a binary on PATH once and remember the answer"""
+        if self._available is None:
+            self._available = shutil.which(name) is not None
+        return self._available
+
     def check_available(self) -> bool:
         """Check if this tunnel method is available"""
         raise NotImplementedError
@@ -44,28 +98,42 @@ class NgrokTunnelSkill(SSLTunnelSkill):
     name = "ngrok_tunnel"
     description = "Set up ngrok tunnel for temporary SSL access"
 
+    __slots__ = ("_process",)
+
+    def __init__(self):
+        super().__init__()
+        self._process: Optional[subprocess.Popen] = None
+
     def check_available(self) -> bool:
         """Check if ngrok is installed"""
-        result = subprocess.run(
-            ["which", "ngrok"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
+        return self._has_binary("ngrok")
 
     def install(self) -> Dict[str, Any]:
         """Install ngrok"""
-        commands = [
-            "curl -s https://ngrok-agent.s3.amazonaws.com/ngrok.asc | sudo tee /etc/apt/trusted.gpg.d/ngrok.asc >/dev/null",
-            'echo "deb https://ngrok-agent.s3.amazonaws.com buster main" | sudo tee /etc/apt/sources.list.d/ngrok.list',
-            "sudo apt update && sudo apt install -y ngrok"
-        ]
-
-        for cmd in commands:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                return {"success": False, "error": result.stderr}
-
+        # curl's output is handed to tee in-process rather than via a shell pipe
+        try:
+            key = subprocess.run(
+                ["curl", "-s", "https://ngrok-agent.s3.amazonaws.com/ngrok.asc"],
+                capture_output=True
+            )
+        except OSError as e:
+            return {"success": False, "error": str(e)}
+        if key.returncode != 0:
+            return {"success": False, "error": key.stderr.decode("utf-8", "replace")}
+
+        error = _run_commands([
+            (["sudo", "tee", "/etc/apt/trusted.gpg.d/ngrok.asc"], key.stdout),
+            (
+                ["sudo", "tee", "/etc/apt/sources.list.d/ngrok.list"],
+                b"deb https://ngrok-agent.s3.amazonaws.com buster main\n"
+            ),
+            (["sudo", "apt", "update"], None),
+            (["sudo", "apt", "install", "-y", "ngrok"], None),
+        ])
+        if error is not None:
+            return {"success": False, "error": error}
+
+        self._available = None
         return {"success": True, "message": "ngrok installed successfully"}
 
     def setup(self, port: int = 6167, auth_token: Optional[str] = None) -> Dict[str, Any]:
@@ -80,67 +148,83 @@ class NgrokTunnelSkill(SSLTunnelSkill):
         if auth_token:
             subprocess.run(
                 ["ngrok", "config", "add-authtoken", auth_token],
-                capture_output=True
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
             )
 
         # Start tunnel
         try:
             # Kill any existing ngrok
-            subprocess.run(["pkill", "ngrok"], capture_output=True)
+            self._stop()
 
             # Start new tunnel in background
-            subprocess.Popen(
+            self._process = subprocess.Popen(
                 ["ngrok", "http", str(port), "--log=stdout"],
                 stdout=subprocess.DEVNULL,
                 stderr=subprocess.DEVNULL
             )
 
-            # Wait for tunnel to start
-            import time
-            time.sleep(3)
-
-            # Get public URL from ngrok API
-            result = subprocess.run(
-                ["curl", "-s", "http://localhost:4040/api/tunnels"],
-                capture_output=True,
-                text=True
-            )
-
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                if data.get("tunnels"):
-                    public_url = data["tunnels"][0]["public_url"]
+            # Poll the ngrok API until the tunnel reports its public URL
+            deadline = time.monotonic() + NGROK_STARTUP_TIMEOUT
+            while time.monotonic() < deadline and self._process.poll() is None:
+                try:
+                    public_url = self._fetch_public_url(timeout=0.2)
+                except (OSError, ValueError, LookupError):
+                    public_url = None  # API not up yet
+                if public_url:
                     return {
                         "success": True,
                         "url": public_url,
                         "message": f"ngrok tunnel active: {public_url}"
                     }
+                time.sleep(NGROK_POLL_INTERVAL)
 
             return {"success": False, "error": "Failed to get tunnel URL"}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
 
+    def _fetch_public_url(self, timeout: float = 2) -> Optional[str]:
+        """Query ngrok's local API for the first tunnel's public URL"""
+        with urllib.request.urlopen(NGROK_API_URL, timeout=timeout) as response:
+            data = json.load(response)
+        if data.get("tunnels"):
+            return data["tunnels"][0]["public_url"]
+        return None
+
     def get_url(self) -> Optional[str]:
         """Get current ngrok URL"""
         try:
+            return self._fetch_public_url()
+        except (OSError, ValueError, LookupError):
+            return None
+
+    def _stop(self) -> bool:
+        """Stop the ngrok we started, or any ngrok if we have not started one"""
+        process, self._process = self._process, None
+        if process is None:
             result = subprocess.run(
-                ["curl", "-s", "http://localhost:4040/api/tunnels"],
-                capture_output=True,
-                text=True
+                ["pkill", "ngrok"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
             )
-            if result.returncode == 0:
-                data = json.loads(result.stdout)
-                if data.get("tunnels"):
-                    return data["tunnels"][0]["public_url"]
-        except:
-            pass
-        return None
+            return result.returncode == 0
+
+        if process.poll() is not None:
+            return False
+        process.terminate()
+        try:
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        return True
 
     def teardown(self) -> bool:
         """Stop ngrok tunnel"""
-        result = subprocess.run(["pkill", "ngrok"], capture_output=True)
-        return result.returncode == 0
+        return self._stop()
 
 
 class CloudflareTunnelSkill(SSLTunnelSkill):
@@ -149,28 +233,30 @@ class CloudflareTunnelSkill(SSLTunnelSkill):
     name = "cloudflare_tunnel"
     description = "Set up Cloudflare tunnel for permanent SSL access"
 
+    __slots__ = ()
+
     def check_available(self) -> bool:
         """Check if cloudflared is installed"""
-        result = subprocess.run(
-            ["which", "cloudflared"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
+        return self._has_binary("cloudflared")
 
     def install(self) -> Dict[str, Any]:
         """Install cloudflared"""
-        commands = [
-            "curl -L https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64 -o /tmp/cloudflared",
-            "chmod +x /tmp/cloudflared",
-            "sudo mv /tmp/cloudflared /usr/local/bin/cloudflared"
-        ]
-
-        for cmd in commands:
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if result.returncode != 0:
-                return {"success": False, "error": result.stderr}
-
+        error = _run_commands([
+            (
+                [
+                    "curl", "-L",
+                    "https://github.com/cloudflare/cloudflared/releases/latest/download/cloudflared-linux-amd64",
+                    "-o", "/tmp/cloudflared"
+                ],
+                None
+            ),
+            (["chmod", "+x", "/tmp/cloudflared"], None),
+            (["sudo", "mv", "/tmp/cloudflared", "/usr/local/bin/cloudflared"], None),
+        ])
+        if error is not None:
+            return {"success": False, "error": error}
+
+        self._available = None
         return {"success": True, "message": "cloudflared installed successfully"}
 
     def setup(self, port: int = 6167, quick: bool = True) -> Dict[str, Any]:
@@ -189,33 +275,45 @@ class CloudflareTunnelSkill(SSLTunnelSkill):
 
         try:
             # Kill any existing cloudflared
-            subprocess.run(["pkill", "cloudflared"], capture_output=True)
+            subprocess.run(
+                ["pkill", "cloudflared"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False
+            )
 
             if quick:
                 # Quick tunnel - no account needed
                 process = subprocess.Popen(
                     ["cloudflared", "tunnel", "--url", f"http://localhost:{port}"],
                     stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    text=True
+                    stderr=subprocess.STDOUT
                 )
 
-                # Wait for URL in output
-                import time
-                for _ in range(30):  # 30 second timeout
-                    line = process.stdout.readline()
-                    if "trycloudflare.com" in line:
-                        # Extract URL
-                        import re
-                        match = re.search(r'https://[^\s]+\.trycloudflare\.com', line)
+                # Wait for URL in output, returning as soon as it appears
+                deadline = time.monotonic() + CLOUDFLARE_URL_TIMEOUT
+                output = b""
+                with selectors.DefaultSelector() as selector:
+                    selector.register(process.stdout, selectors.EVENT_READ)
+                    while True:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not selector.select(remaining):
+                            break
+                        chunk = os.read(process.stdout.fileno(), 4096)
+                        if not chunk:
+                            break  # cloudflared exited
+                        output += chunk
+                        if b"trycloudflare.com" not in output:
+                            continue
+                        match = _CF_URL_RE.search(output)
                         if match:
+                            url = match.group(0).decode("ascii", "replace")
                             return {
                                 "success": True,
-                                "url": match.group(0),
-                                "message": f"Cloudflare tunnel active: {match.group(0)}",
+                                "url": url,
+                                "message": f"Cloudflare tunnel active: {url}",
                                 "note": "This URL is temporary. For permanent URL, use: cloudflared tunnel login"
                             }
-                    time.sleep(1)
 
                 return {"success": False, "error": "Timeout waiting for tunnel URL"}
 
@@ -236,7 +334,12 @@ class CloudflareTunnelSkill(SSLTunnelSkill):
 
     def teardown(self) -> bool:
         """Stop cloudflared tunnel"""
-        result = subprocess.run(["pkill", "cloudflared"], capture_output=True)
+        result = subprocess.run(
+            ["pkill", "cloudflared"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=False
+        )
         return result.returncode == 0
 
 
@@ -246,14 +349,11 @@ class SelfSignedCertSkill(SSLTunnelSkill):
     name = "self_signed_cert"
     description = "Generate self-signed SSL certificate"
 
+    __slots__ = ()
+
     def check_available(self) -> bool:
         """Check if openssl is installed"""
-        result = subprocess.run(
-            ["which", "openssl"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0
+        return self._has_binary("openssl")
 
     def setup(
         self,
@@ -304,17 +404,39 @@ class SelfSignedCertSkill(SSLTunnelSkill):
         return True
 
 
-# Skill registry
-SSL_SKILLS = {
-    "ngrok": NgrokTunnelSkill(),
-    "cloudflare": CloudflareTunnelSkill(),
-    "self_signed": SelfSignedCertSkill()
+class _SkillRegistry(Mapping):
+    """Read-only name -> skill mapping that constructs each skill on first lookup"""
+
+    def __init__(self, skill_classes: Dict[str, type]):
+        self._classes = skill_classes
+        self._instances: Dict[str, SSLTunnelSkill] = {}
+
+    def __getitem__(self, name: str) -> SSLTunnelSkill:
+        skill = self._instances.get(name)
+        if skill is None:
+            skill = self._instances[name] = self._classes[name]()
+        return skill
+
+    def __iter__(self):
+        return iter(self._classes)
+
+    def __len__(self) -> int:
+        return len(self._classes)
+
+
+_SKILL_CLASSES = {
+    "ngrok": NgrokTunnelSkill,
+    "cloudflare": CloudflareTunnelSkill,
+    "self_signed": SelfSignedCertSkill
 }
 
+# Skill registry
+SSL_SKILLS = _SkillRegistry(_SKILL_CLASSES)
+
 
 def list_ssl_skills() -> Dict[str, str]:
     """List available SSL skills with descriptions"""
-    return {name: skill.description for name, skill in SSL_SKILLS.items()}
+    return {name: cls.description for name, cls in _SKILL_CLASSES.items()}
 
 
 def setup_ssl_tunnel(method: str, **kwargs) -> Dict[str, Any]:
@@ -335,34 +457,57 @@ def setup_ssl_tunnel(method: str, **kwargs) -> Dict[str, Any]:
     return skill.setup(**kwargs)
 
 
-def get_ssl_status() -> Dict[str, Any]:
-    """Get current SSL/tunnel status"""
+def _ssl_status(ngrok_url: Optional[str], cert_exists: bool) -> Dict[str, Any]:
+    """Assemble the status dict from the probe results"""
     status = {}
 
     # Check ngrok
-    ngrok = SSL_SKILLS["ngrok"]
-    if ngrok.check_available():
-        url = ngrok.get_url()
+    if SSL_SKILLS["ngrok"].check_available():
         status["ngrok"] = {
             "installed": True,
-            "active": url is not None,
-            "url": url
+            "active": ngrok_url is not None,
+            "url": ngrok_url
         }
     else:
         status["ngrok"] = {"installed": False, "active": False}
 
     # Check cloudflare
-    cf = SSL_SKILLS["cloudflare"]
     status["cloudflare"] = {
-        "installed": cf.check_available(),
+        "installed": SSL_SKILLS["cloudflare"].check_available(),
         "active": False  # Would need to check process
     }
 
     # Check self-signed cert
-    cert_path = "/etc/armorclaw/ssl/cert.pem"
     status["self_signed"] = {
-        "exists": os.path.exists(cert_path),
-        "path": cert_path if os.path.exists(cert_path) else None
+        "exists": cert_exists,
+        "path": SELF_SIGNED_CERT_PATH if cert_exists else None
     }
 
     return status
+
+
+def get_ssl_status() -> Dict[str, Any]:
+    """Get current SSL/tunnel status"""
+    ngrok = SSL_SKILLS["ngrok"]
+    ngrok_url = ngrok.get_url() if ngrok.check_available() else None
+    return _ssl_status(ngrok_url, os.path.exists(SELF_SIGNED_CERT_PATH))
+
+
+async def get_ssl_status_async() -> Dict[str, Any]:
+    """
+    Get current SSL/tunnel status without blocking the event loop
+
+    The ngrok API query and the certificate check run concurrently in
+    worker threads, so the call takes as long as the slowest probe.
+    """
+    ngrok = SSL_SKILLS["ngrok"]
+    if ngrok.check_available():
+        url_probe = asyncio.to_thread(ngrok.get_url)
+    else:
+        url_probe = asyncio.sleep(0, result=None)
+
+    ngrok_url, cert_exists = await asyncio.gather(
+        url_probe,
+        asyncio.to_thread(os.path.exists, SELF_SIGNED_CERT_PATH)
+    )
+    return _ssl_status(ngrok_url, cert_exists)
@@ -0,0 +1,278 @@
+"""Tests for the ArmorClaw agent's Matrix handling."""
+
+import asyncio
+import json
+import signal
+
+import pytest
+
+from openclaw import agent as agent_mod
+from openclaw.agent import ArmorClawAgent
+
+
+class FakeBridgeClient:
+    """Async bridge client stand-in that replays canned matrix_receive results."""
+
+    def __init__(self, receive_results):
+        self.receive_results = list(receive_results)
+        self.sent = []
+
+    async def matrix_receive(self, cursor="", timeout_ms=30000):
+        return self.receive_results.pop(0)
+
+    async def matrix_send(self, room_id, message, msgtype="m.text"):
+        self.sent.append((room_id, message))
+        return {"event_id": "$sent"}
+
+    async def attach_config(self, name, content, encoding="raw", config_type="", metadata=None):
+        self.attached = (name, content, encoding, config_type)
+        return {"config_id": "cfg-1", "name": name, "size": len(content)}
+
+
+def _text_event(body, sender="@alice:example.com"):
+    return {"sender": sender, "content": {"msgtype": "m.text", "body": body}}
+
+
+@pytest.fixture
+def agent():
+    a = ArmorClawAgent(bridge_socket="/nonexistent/bridge.sock")
+    a.matrix_room_id = "!room:example.com"
+    return a
+
+
+class TestMatrixLoop:
+
+    def _run(self, agent, results, monkeypatch):
+        agent.bridge_client = FakeBridgeClient(results)
+        sleeps = []
+
+        async def fake_sleep(delay):
+            sleeps.append(delay)
+            if not agent.bridge_client.receive_results:
+                agent.running = False
+
+        monkeypatch.setattr(agent_mod.asyncio, "sleep", fake_sleep)
+        agent.running = True
+        asyncio.run(agent.run_matrix_loop())
+        return sleeps
+
+    def test_empty_polls_back_off_to_cap(self, agent, monkeypatch):
+        empty = {"events": [], "count": 0, "cursor": "0"}
+        sleeps = self._run(agent, [empty] * 8, monkeypatch)
+
+        assert sleeps[0] == agent_mod.MATRIX_POLL_MIN_SLEEP
+        assert sleeps == sorted(sleeps)
+        assert sleeps[-1] == agent_mod.MATRIX_POLL_MAX_SLEEP
+
+    def test_events_poll_immediately_and_reset_backoff(self, agent, monkeypatch):
+        empty = {"events": [], "count": 0, "cursor": "1"}
+        busy = {"events": [_text_event("/ping")], "count": 1, "cursor": "2"}
+        sleeps = self._run(agent, [empty, empty, busy, empty], monkeypatch)
+
+        assert sleeps == [
+            agent_mod.MATRIX_POLL_MIN_SLEEP,
+            agent_mod.MATRIX_POLL_MIN_SLEEP * 2,
+            agent_mod.MATRIX_POLL_MIN_SLEEP,
+        ]
+        assert len(agent.bridge_client.sent) == 1
+        assert "Pong" in agent.bridge_client.sent[0][1]
+
+    def test_non_text_events_are_skipped(self, agent, monkeypatch):
+        seen = []
+
+        async def fake_process(body, sender):
+            seen.append((body, sender))
+            return None
+
+        monkeypatch.setattr(agent, "process_matrix_message", fake_process)
+        image = {"sender": "@bob:example.com", "content": {"msgtype": "m.image", "body": "x.png"}}
+        busy = {"events": [image, _text_event("hello")], "count": 2, "cursor": "1"}
+        sleeps = self._run(agent, [busy, {"events": [], "count": 0}], monkeypatch)
+
+        assert seen == [("hello", "@alice:example.com")]
+        assert sleeps == [agent_mod.MATRIX_POLL_MIN_SLEEP]
+
+    def test_received_message_log_truncates_body(self, agent, caplog):
+        with caplog.at_level("INFO", logger=agent_mod.logger.name):
+            asyncio.run(agent.process_matrix_message("/ping" + "x" * 500, "@alice:example.com"))
+
+        messages = [r.getMessage() for r in caplog.records]
+        expected = "Received Matrix message from @alice:example.com: /ping" + "x" * 95
+        assert expected in messages
+
+
+class TestStartupInfo:
+
+    @pytest.fixture(autouse=True)
+    def clean_env(self, monkeypatch):
+        for env_var, _ in agent_mod._PROVIDER_MAP:
+            monkeypatch.delenv(env_var, raising=False)
+        yield
+        monkeypatch.undo()
+        agent_mod._refresh()
+
+    def test_no_credentials(self):
+        agent_mod._refresh()
+        assert agent_mod._STARTUP_INFO.providers == ()
+        assert agent_mod.verify_credentials() is False
+
+    def test_present_providers_in_map_order(self, monkeypatch):
+        monkeypatch.setenv("XAI_API_KEY", "x")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+        monkeypatch.setenv("GEMINI_API_KEY", "")
+        agent_mod._refresh()
+
+        assert agent_mod._STARTUP_INFO.providers == ("OpenAI", "xAI")
+        assert agent_mod.verify_credentials() is True
+
+    def test_log_startup_uses_scanned_env(self, monkeypatch, caplog):
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-secret")
+        monkeypatch.setenv("ARMORCLAW_BRIDGE_SOCKET", "/tmp/test-bridge.sock")
+        monkeypatch.delenv("ARMORCLAW_MATRIX_ROOM", raising=False)
+        agent_mod._refresh()
+
+        with caplog.at_level("INFO", logger=agent_mod.logger.name):
+            agent_mod.log_startup()
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert "Agent starting with 1 configured provider(s): Anthropic" in messages
+        assert "Bridge socket: /tmp/test-bridge.sock" in messages
+        assert "Matrix room: Not configured" in messages
+        assert not any("sk-ant-secret" in m for m in messages)
+
+
+class TestVerifyEnvironment:
+
+    def test_warns_for_dangerous_tools_present(self, tmp_path, monkeypatch, caplog):
+        bin_dir = tmp_path / "bin"
+        usr_bin = tmp_path / "usr_bin"
+        bin_dir.mkdir()
+        usr_bin.mkdir()
+        for name in ("sh", "ls"):
+            (bin_dir / name).touch()
+        (usr_bin / "curl").touch()
+        monkeypatch.setattr(
+            agent_mod,
+            "_DANGEROUS_TOOLS",
+            (
+                str(bin_dir / "sh"),
+                str(bin_dir / "bash"),
+                str(usr_bin / "curl"),
+                str(tmp_path / "missing" / "nc"),
+            ),
+        )
+
+        with caplog.at_level("WARNING", logger=agent_mod.logger.name):
+            assert agent_mod.verify_environment() is True
+
+        warned = sorted(
+            r.getMessage() for r in caplog.records if "Dangerous tool" in r.getMessage()
+        )
+        assert warned == [
+            f"Dangerous tool exists: {bin_dir / 'sh'}",
+            f"Dangerous tool exists: {usr_bin / 'curl'}",
+        ]
+
+
+class TestStart:
+
+    def test_initialize_and_loop_share_event_loop(self, agent, monkeypatch):
+        loops = []
+
+        async def fake_initialize():
+            loops.append(asyncio.get_running_loop())
+
+        async def fake_run_agent_loop():
+            loops.append(asyncio.get_running_loop())
+
+        monkeypatch.setattr(agent, "initialize", fake_initialize)
+        monkeypatch.setattr(agent, "run_agent_loop", fake_run_agent_loop)
+
+        agent.start()
+
+        assert len(loops) == 2
+        assert loops[0] is loops[1]
+
+    def test_stop_wakes_agent_loop(self, agent):
+        agent.matrix_room_id = ""
+
+        async def run():
+            loop_task = asyncio.create_task(agent.run_agent_loop())
+            await asyncio.sleep(0)
+            assert agent.running
+            agent.stop()
+            await asyncio.wait_for(loop_task, timeout=1)
+
+        asyncio.run(run())
+        assert agent.running is False
+
+    def test_sigterm_stops_agent(self, agent, monkeypatch):
+        # Record the handlers instead of installing them, so no real signal
+        # is involved
+        handlers = {}
+
+        def fake_add_signal_handler(loop, signum, callback, *args):
+            handlers[signum] = (callback, args)
+
+        monkeypatch.setattr(
+            asyncio.SelectorEventLoop, "add_signal_handler", fake_add_signal_handler
+        )
+
+        async def fake_initialize():
+            callback, args = handlers[signal.SIGTERM]
+            asyncio.get_running_loop().call_soon(callback, *args)
+
+        monkeypatch.setattr(agent, "initialize", fake_initialize)
+
+        agent.start()
+
+        assert handlers == {
+            signal.SIGTERM: (agent._handle_signal, (signal.SIGTERM,)),
+            signal.SIGINT: (agent._handle_signal, (signal.SIGINT,)),
+        }
+        assert agent.running is False
+
+    def test_handle_signal_sets_stop_event(self, agent):
+        agent._stop = asyncio.Event()
+
+        agent._handle_signal(signal.SIGTERM)
+
+        assert agent._stop.is_set()
+        assert agent.running is False
+
+
+class TestHandleCommand:
+
+    def _cmd(self, agent, body):
+        return asyncio.run(agent._handle_command(body, "@alice:example.com"))
+
+    def test_ping(self, agent):
+        assert "Pong" in self._cmd(agent, "/ping")
+
+    def test_dispatch_is_case_insensitive(self, agent):
+        assert self._cmd(agent, "/HELP").startswith("**ArmorClaw OpenClaw Agent Commands**")
+
+    def test_status_reports_bridge_state(self, agent):
+        reply = self._cmd(agent, "/status")
+        assert "\n" not in reply
+        status = json.loads(reply)
+        assert status["bridge_connected"] is False
+        assert status["matrix_enabled"] is True
+
+    def test_unknown_command(self, agent):
+        assert self._cmd(agent, "/nope extra") == "Unknown command: /nope. Try /help"
+
+    def test_attach_config_usage(self, agent):
+        assert self._cmd(agent, "/attach_config agent.env").startswith("Usage:")
+
+    def test_attach_config_preserves_content_whitespace(self, agent):
+        agent.bridge_client = FakeBridgeClient([])
+        reply = self._cmd(agent, "/attach_config agent.env MODEL=gpt-4\nTEMPERATURE=0.7  # x")
+
+        assert reply.startswith("✅ Config attached:")
+        assert agent.bridge_client.attached == (
+            "agent.env",
+            "MODEL=gpt-4\nTEMPERATURE=0.7  # x",
+            "raw",
+            "env",
+        )
@@ -0,0 +1,300 @@
+"""Tests for the bridge client JSON-RPC transport."""
+
+import asyncio
+import base64
+import json
+import os
+import shutil
+import socket
+import tempfile
+import threading
+import time
+
+import pytest
+
+from openclaw import bridge_client
+from openclaw.bridge_client import (
+    ATTACH_CONFIG_BASE64_THRESHOLD,
+    RECV_BUFFER_SIZE,
+    AsyncBridgeClient,
+    BridgeClient,
+    get_default_async_client,
+    get_default_client,
+)
+
+
+class FakeBridge:
+    """Unix-socket server that mimics the bridge: one response per connection."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.requests = []
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "bridge.sock")
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.bind(self.path)
+        self.sock.listen(8)
+        self.thread = threading.Thread(target=self._serve, daemon=True)
+        self.thread.start()
+
+    def _serve(self):
+        while True:
+            try:
+                conn, _ = self.sock.accept()
+            except OSError:
+                return
+            threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+
+    def _handle(self, conn):
+        with conn:
+            data = b""
+            while not data.endswith(b"\n"):
+                chunk = conn.recv(65536)
+                if not chunk:
+                    break
+                data += chunk
+            request = json.loads(data)
+            self.requests.append(request)
+            try:
+                conn.sendall(self.handler(request))
+            except OSError:
+                pass  # client gave up (timeout tests)
+
+    def close(self):
+        self.sock.close()
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+
+def _indented(result):
+    def handler(request):
+        resp = {"jsonrpc": "2.0", "id": request["id"], "result": result}
+        # The Go bridge encodes responses with SetIndent("", "  ")
+        return (json.dumps(resp, indent=2) + "\n").encode("utf-8")
+
+    return handler
+
+
+@pytest.fixture
+def bridge_factory():
+    bridges = []
+
+    def make(handler):
+        bridge = FakeBridge(handler)
+        bridges.append(bridge)
+        return bridge
+
+    yield make
+    for bridge in bridges:
+        bridge.close()
+
+
+class TestBridgeClientSendRequest:
+
+    def test_result_returned(self, bridge_factory):
+        bridge = bridge_factory(_indented({"status": "ok"}))
+        client = BridgeClient(bridge.path)
+
+        assert client.health() == {"status": "ok"}
+        assert bridge.requests[0]["method"] == "health"
+        assert "params" not in bridge.requests[0]
+
+    def test_params_sent(self, bridge_factory):
+        bridge = bridge_factory(_indented({"event_id": "$1"}))
+        client = BridgeClient(bridge.path)
+
+        client.matrix_send("!room:example.com", "hi")
+        assert bridge.requests[0]["params"] == {
+            "room_id": "!room:example.com",
+            "message": "hi",
+            "msgtype": "m.text",
+        }
+
+    def test_large_multiline_response(self, bridge_factory):
+        events = [{"content": {"body": "x" * 1000, "msgtype": "m.text"}}] * 500
+        bridge = bridge_factory(_indented({"events": events, "count": 500}))
+        client = BridgeClient(bridge.path)
+
+        result = client.matrix_receive()
+        assert result["count"] == 500
+        assert result["events"] == events
+
+    def test_response_exactly_fills_buffer(self, bridge_factory):
+        overhead = len(json.dumps({"jsonrpc": "2.0", "id": 1, "result": ""}) + "\n")
+        payload = "y" * (RECV_BUFFER_SIZE - overhead)
+
+        def handler(request):
+            resp = {"jsonrpc": "2.0", "id": request["id"], "result": payload}
+            frame = (json.dumps(resp) + "\n").encode("utf-8")
+            assert len(frame) == RECV_BUFFER_SIZE
+            return frame
+
+        bridge = bridge_factory(handler)
+        client = BridgeClient(bridge.path)
+
+        assert client.status() == payload
+
+    def test_request_ids_increment(self, bridge_factory):
+        bridge = bridge_factory(_indented({}))
+        client = BridgeClient(bridge.path)
+
+        client.status()
+        client.status()
+        assert [r["id"] for r in bridge.requests] == [1, 2]
+
+    def test_rpc_error_raises_runtime_error(self, bridge_factory):
+        def handler(request):
+            resp = {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": "method not found"},
+            }
+            return (json.dumps(resp) + "\n").encode("utf-8")
+
+        bridge = bridge_factory(handler)
+        client = BridgeClient(bridge.path)
+
+        with pytest.raises(RuntimeError, match="-32601"):
+            client.status()
+
+    def test_small_config_sent_raw(self, bridge_factory):
+        bridge = bridge_factory(_indented({"config_id": "cfg-1"}))
+        client = BridgeClient(bridge.path)
+
+        client.attach_config("agent.env", "MODEL=gpt-4\n", config_type="env")
+        params = bridge.requests[0]["params"]
+        assert params == {
+            "name": "agent.env",
+            "content": "MODEL=gpt-4\n",
+            "encoding": "raw",
+            "type": "env",
+        }
+
+    def test_large_raw_config_promoted_to_base64(self, bridge_factory):
+        bridge = bridge_factory(_indented({"config_id": "cfg-1"}))
+        client = BridgeClient(bridge.path)
+        content = 'KEY="väl\\ue"\n' * (ATTACH_CONFIG_BASE64_THRESHOLD // 10)
+
+        client.attach_config("big.env", content)
+        params = bridge.requests[0]["params"]
+        assert params["encoding"] == "base64"
+        assert base64.b64decode(params["content"]).decode("utf-8") == content
+
+    def test_missing_socket_raises_connection_error(self, tmp_path):
+        client = BridgeClient(str(tmp_path / "missing.sock"))
+
+        with pytest.raises(ConnectionError, match="not found"):
+            client.health()
+
+
+class TestAsyncBridgeClientSendRequest:
+
+    def test_large_multiline_response(self, bridge_factory):
+        events = [{"content": {"body": "x" * 1000, "msgtype": "m.text"}}] * 500
+        bridge = bridge_factory(_indented({"events": events, "count": 500}))
+        client = AsyncBridgeClient(bridge.path)
+
+        result = asyncio.run(client.matrix_receive())
+        assert result["events"] == events
+        assert bridge.requests[0]["method"] == "matrix.receive"
+
+    def test_calls_overlap_with_pending_long_poll(self, bridge_factory):
+        def handler(request):
+            if request["method"] == "matrix.receive":
+                time.sleep(0.5)
+                return _indented({"events": [], "count": 0})(request)
+            return _indented({"event_id": "$1"})(request)
+
+        bridge = bridge_factory(handler)
+        client = AsyncBridgeClient(bridge.path)
+
+        async def run():
+            poll = asyncio.create_task(client.matrix_receive(timeout_ms=1000))
+            await asyncio.sleep(0.05)
+            sent = await asyncio.wait_for(client.matrix_send("!r:x", "hi"), timeout=0.3)
+            assert not poll.done()
+            await poll
+            return sent
+
+        assert asyncio.run(run()) == {"event_id": "$1"}
+
+    def test_large_raw_config_promoted_to_base64(self, bridge_factory):
+        bridge = bridge_factory(_indented({"config_id": "cfg-1"}))
+        client = AsyncBridgeClient(bridge.path)
+        content = "x" * (ATTACH_CONFIG_BASE64_THRESHOLD + 1)
+
+        asyncio.run(client.attach_config("big.env", content, metadata={"k": "v"}))
+        params = bridge.requests[0]["params"]
+        assert params["encoding"] == "base64"
+        assert base64.b64decode(params["content"]).decode("utf-8") == content
+        assert params["metadata"] == {"k": "v"}
+
+    def test_empty_response_raises_connection_error(self, bridge_factory):
+        bridge = bridge_factory(lambda request: b"")
+        client = AsyncBridgeClient(bridge.path)
+
+        with pytest.raises(ConnectionError, match="Invalid response"):
+            asyncio.run(client.health())
+
+
+def _slow(delay, result=None):
+    respond = _indented(result)
+
+    def handler(request):
+        time.sleep(delay)
+        return respond(request)
+
+    return handler
+
+
+class TestTimeouts:
+
+    def test_sync_timeout_raises_connection_error(self, bridge_factory):
+        bridge = bridge_factory(_slow(0.5))
+        client = BridgeClient(bridge.path, timeout=0.1)
+
+        with pytest.raises(ConnectionError, match="timed out after 0.1s"):
+            client.status()
+
+    def test_sync_matrix_receive_allows_long_poll(self, bridge_factory):
+        bridge = bridge_factory(_slow(0.3, {"events": [], "count": 0}))
+        client = BridgeClient(bridge.path, timeout=0.1)
+
+        assert client.matrix_receive(timeout_ms=500)["count"] == 0
+
+    def test_async_timeout_raises_connection_error(self, bridge_factory):
+        bridge = bridge_factory(_slow(0.5))
+        client = AsyncBridgeClient(bridge.path, timeout=0.1)
+
+        with pytest.raises(ConnectionError, match="timed out after 0.1s"):
+            asyncio.run(client.status())
+
+    def test_async_matrix_receive_allows_long_poll(self, bridge_factory):
+        bridge = bridge_factory(_slow(0.3, {"events": [], "count": 0}))
+        client = AsyncBridgeClient(bridge.path, timeout=0.1)
+
+        assert asyncio.run(client.matrix_receive(timeout_ms=500))["count"] == 0
+
+
+class TestDefaultClients:
+
+    @pytest.fixture(autouse=True)
+    def empty_caches(self, monkeypatch):
+        # Keep clients created here out of the module-level caches
+        monkeypatch.setattr(bridge_client, "_default_clients", {})
+        monkeypatch.setattr(bridge_client, "_default_async_clients", {})
+
+    def test_default_client_is_shared_per_socket_path(self, monkeypatch):
+        monkeypatch.setenv("ARMORCLAW_BRIDGE_SOCKET", "/tmp/a.sock")
+        first = get_default_client()
+        assert first is get_default_client()
+        assert first.socket_path == "/tmp/a.sock"
+
+        other = get_default_client("/tmp/b.sock")
+        assert other is not first
+        assert other.socket_path == "/tmp/b.sock"
+
+    def test_default_async_client_is_shared(self, monkeypatch):
+        monkeypatch.setenv("ARMORCLAW_BRIDGE_SOCKET", "/tmp/a.sock")
+        client = get_default_async_client()
+        assert isinstance(client, AsyncBridgeClient)
+        assert client is get_default_async_client("/tmp/a.sock")
@@ -0,0 +1,59 @@
+"""Tests for the lazily loaded SSL skill instructions."""
+
+import pathlib
+
+import pytest
+
+import openclaw.skills
+from openclaw.skills import ssl_skill_handler
+
+
+class TestLazyInstructions:
+
+    @pytest.fixture
+    def fresh_handler(self, monkeypatch):
+        """Drop any cached values and count reads of the instructions file."""
+        for name in ("SSL_SETUP_INSTRUCTIONS", "DEFAULT_SKILLS"):
+            monkeypatch.delitem(vars(ssl_skill_handler), name, raising=False)
+
+        reads = []
+        real_read_text = pathlib.Path.read_text
+
+        def read_text(path, *args, **kwargs):
+            reads.append(path)
+            return real_read_text(path, *args, **kwargs)
+
+        monkeypatch.setattr(pathlib.Path, "read_text", read_text)
+        return reads
+
+    def test_instructions_loaded_from_markdown(self):
+        instructions = ssl_skill_handler.SSL_SETUP_INSTRUCTIONS
+
+        assert instructions.startswith("# SSL and External Access Setup\n")
+        assert "## SECURITY RULES (CRITICAL)" in instructions
+        assert ssl_skill_handler.SSL_SETUP_INSTRUCTIONS is instructions
+
+    def test_default_skills_reference_instructions(self):
+        skill = openclaw.skills.DEFAULT_SKILLS["ssl_setup"]
+
+        assert skill["module"] == "openclaw.skills.ssl_tunnel_setup"
+        assert skill["instructions"] is openclaw.skills.SSL_SETUP_INSTRUCTIONS
+        assert "cloudflare" in skill["triggers"]
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError, match="NOT_A_SKILL"):
+            openclaw.skills.NOT_A_SKILL
+
+    def test_instructions_then_default_skills_reads_file_once(self, fresh_handler):
+        instructions = ssl_skill_handler.SSL_SETUP_INSTRUCTIONS
+        skills = ssl_skill_handler.DEFAULT_SKILLS
+
+        assert skills["ssl_setup"]["instructions"] is instructions
+        assert ssl_skill_handler.SSL_SETUP_INSTRUCTIONS is instructions
+        assert fresh_handler == [ssl_skill_handler._INSTRUCTIONS_PATH]
+
+    def test_default_skills_first_caches_instructions(self, fresh_handler):
+        skills = ssl_skill_handler.DEFAULT_SKILLS
+
+        assert ssl_skill_handler.SSL_SETUP_INSTRUCTIONS is skills["ssl_setup"]["instructions"]
+        assert len(fresh_handler) == 1
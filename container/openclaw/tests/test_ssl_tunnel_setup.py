@@ -0,0 +1,334 @@
+"""Tests for the SSL tunnel setup skills."""
+
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from openclaw.skills import ssl_tunnel_setup
+from openclaw.skills.ssl_tunnel_setup import (
+    CloudflareTunnelSkill,
+    NgrokTunnelSkill,
+    SelfSignedCertSkill,
+)
+
+
+class TestCheckAvailable:
+
+    @pytest.fixture
+    def which_calls(self, monkeypatch):
+        calls = []
+
+        def fake_which(name):
+            calls.append(name)
+            return f"/usr/bin/{name}" if name != "ngrok" else None
+
+        monkeypatch.setattr(ssl_tunnel_setup.shutil, "which", fake_which)
+        return calls
+
+    def test_result_is_cached_per_instance(self, which_calls):
+        skill = CloudflareTunnelSkill()
+
+        assert skill.check_available() is True
+        assert skill.check_available() is True
+        assert which_calls == ["cloudflared"]
+
+    def test_each_skill_looks_up_its_binary(self, which_calls):
+        assert NgrokTunnelSkill().check_available() is False
+        assert SelfSignedCertSkill().check_available() is True
+        assert which_calls == ["ngrok", "openssl"]
+
+    def test_successful_install_clears_cache(self, which_calls, monkeypatch):
+        skill = NgrokTunnelSkill()
+        assert skill.check_available() is False
+
+        monkeypatch.setattr(
+            ssl_tunnel_setup.subprocess,
+            "run",
+            lambda *a, **kw: subprocess.CompletedProcess(a, 0, "", ""),
+        )
+        assert skill.install()["success"] is True
+        skill.check_available()
+        assert which_calls == ["ngrok", "ngrok"]
+
+
+class TestSkillRegistry:
+
+    def test_skills_constructed_on_first_lookup(self):
+        registry = ssl_tunnel_setup._SkillRegistry(ssl_tunnel_setup._SKILL_CLASSES)
+        assert registry._instances == {}
+        assert list(registry) == ["ngrok", "cloudflare", "self_signed"]
+
+        ngrok = registry["ngrok"]
+        assert isinstance(ngrok, NgrokTunnelSkill)
+        assert registry["ngrok"] is ngrok
+        assert list(registry._instances) == ["ngrok"]
+
+    def test_unknown_method(self):
+        assert ssl_tunnel_setup.SSL_SKILLS.get("carrier_pigeon") is None
+        assert ssl_tunnel_setup.setup_ssl_tunnel("carrier_pigeon") == {
+            "success": False,
+            "error": "Unknown method: carrier_pigeon",
+        }
+
+    def test_list_ssl_skills(self):
+        assert ssl_tunnel_setup.list_ssl_skills() == {
+            "ngrok": NgrokTunnelSkill.description,
+            "cloudflare": CloudflareTunnelSkill.description,
+            "self_signed": SelfSignedCertSkill.description,
+        }
+
+
+class TestInstall:
+
+    @pytest.fixture
+    def run_calls(self, monkeypatch):
+        calls = []
+
+        def fake_run(argv, input=None, **kwargs):
+            calls.append((argv, input, kwargs.get("shell", False)))
+            failed = argv[:2] == ["sudo", "mv"]
+            stdout = b"-----BEGIN PGP-----" if argv[0] == "curl" else b""
+            return subprocess.CompletedProcess(argv, int(failed), stdout, b"mv: denied" * failed)
+
+        monkeypatch.setattr(ssl_tunnel_setup.subprocess, "run", fake_run)
+        return calls
+
+    def test_ngrok_install_runs_without_shell(self, run_calls):
+        assert NgrokTunnelSkill().install()["success"] is True
+
+        assert not any(shell for _, _, shell in run_calls)
+        assert [argv for argv, _, _ in run_calls] == [
+            ["curl", "-s", "https://ngrok-agent.s3.amazonaws.com/ngrok.asc"],
+            ["sudo", "tee", "/etc/apt/trusted.gpg.d/ngrok.asc"],
+            ["sudo", "tee", "/etc/apt/sources.list.d/ngrok.list"],
+            ["sudo", "apt", "update"],
+            ["sudo", "apt", "install", "-y", "ngrok"],
+        ]
+        # The downloaded key is piped to tee in-process
+        assert run_calls[1][1] == b"-----BEGIN PGP-----"
+
+    def test_cloudflare_install_stops_at_first_failure(self, run_calls):
+        result = CloudflareTunnelSkill().install()
+
+        assert result == {"success": False, "error": "mv: denied"}
+        assert run_calls[-1][0][:2] == ["sudo", "mv"]
+        assert len(run_calls) == 3
+
+    @pytest.mark.parametrize("skill_cls", [NgrokTunnelSkill, CloudflareTunnelSkill])
+    def test_missing_binary_returns_error(self, skill_cls, monkeypatch):
+        # The hardened image ships without curl
+        def fake_run(argv, *args, **kwargs):
+            raise FileNotFoundError(2, "No such file or directory", argv[0])
+
+        monkeypatch.setattr(ssl_tunnel_setup.subprocess, "run", fake_run)
+
+        result = skill_cls().install()
+
+        assert result == {
+            "success": False,
+            "error": "[Errno 2] No such file or directory: 'curl'",
+        }
+
+
+@pytest.fixture
+def ngrok_api(monkeypatch):
+    """Serve a canned /api/tunnels payload and point NGROK_API_URL at it."""
+    state = {"payload": {"tunnels": []}}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = json.dumps(state["payload"]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        ssl_tunnel_setup,
+        "NGROK_API_URL",
+        f"http://127.0.0.1:{server.server_port}/api/tunnels",
+    )
+    yield state
+    server.shutdown()
+    server.server_close()
+
+
+class TestNgrokGetUrl:
+
+    def test_returns_first_public_url(self, ngrok_api):
+        ngrok_api["payload"] = {
+            "tunnels": [
+                {"public_url": "https://abc.ngrok.io"},
+                {"public_url": "http://abc.ngrok.io"},
+            ]
+        }
+        assert NgrokTunnelSkill().get_url() == "https://abc.ngrok.io"
+
+    def test_no_tunnels(self, ngrok_api):
+        assert NgrokTunnelSkill().get_url() is None
+
+    def test_api_unreachable(self, monkeypatch):
+        monkeypatch.setattr(ssl_tunnel_setup, "NGROK_API_URL", "http://127.0.0.1:9/api/tunnels")
+        assert NgrokTunnelSkill().get_url() is None
+
+
+class TestSSLStatus:
+
+    @pytest.fixture
+    def skills(self, monkeypatch, tmp_path):
+        ngrok = NgrokTunnelSkill()
+        ngrok._available = True
+        cloudflare = CloudflareTunnelSkill()
+        cloudflare._available = False
+        monkeypatch.setattr(
+            ssl_tunnel_setup, "SSL_SKILLS", {"ngrok": ngrok, "cloudflare": cloudflare}
+        )
+        cert = tmp_path / "cert.pem"
+        monkeypatch.setattr(ssl_tunnel_setup, "SELF_SIGNED_CERT_PATH", str(cert))
+        return cert
+
+    def test_sync_status(self, skills, ngrok_api):
+        ngrok_api["payload"] = {"tunnels": [{"public_url": "https://abc.ngrok.io"}]}
+        skills.touch()
+
+        assert ssl_tunnel_setup.get_ssl_status() == {
+            "ngrok": {"installed": True, "active": True, "url": "https://abc.ngrok.io"},
+            "cloudflare": {"installed": False, "active": False},
+            "self_signed": {"exists": True, "path": str(skills)},
+        }
+
+    def test_async_status_matches_sync(self, skills, ngrok_api):
+        assert asyncio.run(ssl_tunnel_setup.get_ssl_status_async()) == (
+            ssl_tunnel_setup.get_ssl_status()
+        )
+
+    def test_async_status_without_ngrok(self, skills):
+        ssl_tunnel_setup.SSL_SKILLS["ngrok"]._available = False
+
+        status = asyncio.run(ssl_tunnel_setup.get_ssl_status_async())
+        assert status["ngrok"] == {"installed": False, "active": False}
+        assert status["self_signed"] == {"exists": False, "path": None}
+
+
+@pytest.fixture
+def fake_tunnel(monkeypatch):
+    """Run state["script"] with Python in place of ngrok/cloudflared."""
+    state = {"script": "", "procs": []}
+    real_popen = subprocess.Popen
+
+    def popen(args, **kwargs):
+        proc = real_popen([sys.executable, "-c", state["script"]], **kwargs)
+        state["procs"].append(proc)
+        return proc
+
+    monkeypatch.setattr(NgrokTunnelSkill, "check_available", lambda self: True)
+    monkeypatch.setattr(CloudflareTunnelSkill, "check_available", lambda self: True)
+    monkeypatch.setattr(
+        ssl_tunnel_setup.subprocess,
+        "run",
+        lambda *a, **kw: subprocess.CompletedProcess(a, 1, b"", b""),
+    )
+    monkeypatch.setattr(ssl_tunnel_setup.subprocess, "Popen", popen)
+    yield state
+    for proc in state["procs"]:
+        proc.kill()
+        proc.wait()
+        if proc.stdout:
+            proc.stdout.close()
+
+
+class TestCloudflareQuickTunnel:
+
+    def test_returns_as_soon_as_url_is_printed(self, fake_tunnel):
+        fake_tunnel["script"] = (
+            "import time\n"
+            "print('INF Requesting new quick Tunnel', flush=True)\n"
+            "print('INF |  https://calm-river-42.trycloudflare.com  |', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        started = time.monotonic()
+        result = CloudflareTunnelSkill().setup(port=8080)
+
+        assert result["success"] is True
+        assert result["url"] == "https://calm-river-42.trycloudflare.com"
+        assert time.monotonic() - started < 1
+
+    def test_url_split_across_writes(self, fake_tunnel):
+        fake_tunnel["script"] = (
+            "import sys, time\n"
+            "sys.stdout.buffer.write(b'INF |  https://calm-river'); sys.stdout.flush()\n"
+            "time.sleep(0.1)\n"
+            "sys.stdout.buffer.write(b'-42.trycloudflare.com  |\\n'); sys.stdout.flush()\n"
+            "time.sleep(30)\n"
+        )
+        result = CloudflareTunnelSkill().setup(port=8080)
+
+        assert result["url"] == "https://calm-river-42.trycloudflare.com"
+
+    def test_times_out_without_url(self, fake_tunnel, monkeypatch):
+        monkeypatch.setattr(ssl_tunnel_setup, "CLOUDFLARE_URL_TIMEOUT", 0.2)
+        fake_tunnel["script"] = "import time; print('INF starting', flush=True); time.sleep(30)"
+
+        result = CloudflareTunnelSkill().setup(port=8080)
+        assert result == {"success": False, "error": "Timeout waiting for tunnel URL"}
+
+    def test_process_exit_without_url(self, fake_tunnel):
+        fake_tunnel["script"] = "print('ERR failed to start')"
+
+        started = time.monotonic()
+        result = CloudflareTunnelSkill().setup(port=8080)
+
+        assert result["success"] is False
+        assert time.monotonic() - started < 1
+
+
+class TestNgrokSetup:
+
+    def test_returns_once_api_reports_url(self, fake_tunnel, ngrok_api):
+        fake_tunnel["script"] = "import time; time.sleep(30)"
+        ngrok_api["payload"] = {"tunnels": [{"public_url": "https://abc.ngrok.io"}]}
+        skill = NgrokTunnelSkill()
+
+        started = time.monotonic()
+        result = skill.setup(port=8080)
+
+        assert result["url"] == "https://abc.ngrok.io"
+        assert time.monotonic() - started < 1
+
+        process = fake_tunnel["procs"][0]
+        assert skill.teardown() is True
+        assert process.poll() is not None
+
+    def test_process_exit_fails_fast(self, fake_tunnel, ngrok_api):
+        fake_tunnel["script"] = "raise SystemExit(1)"
+
+        started = time.monotonic()
+        result = NgrokTunnelSkill().setup(port=8080)
+
+        assert result == {"success": False, "error": "Failed to get tunnel URL"}
+        assert time.monotonic() - started < 2
+
+    def test_setup_replaces_previous_tunnel(self, fake_tunnel, ngrok_api):
+        fake_tunnel["script"] = "import time; time.sleep(30)"
+        ngrok_api["payload"] = {"tunnels": [{"public_url": "https://abc.ngrok.io"}]}
+        skill = NgrokTunnelSkill()
+
+        skill.setup(port=8080)
+        skill.setup(port=8081)
+
+        first, second = fake_tunnel["procs"]
+        assert first.poll() is not None
+        assert second.poll() is None
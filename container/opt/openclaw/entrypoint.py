@@ -7,8 +7,16 @@ import os
 import sys
 import subprocess
 import json
+import shutil
 import socket  # P0-CRIT-3: For socket-based secret loading
 
+# orjson is optional: it parses the secrets bytes directly, without a
+# separate UTF-8 decode. Its JSONDecodeError subclasses json's.
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 # ============================================================================
 # Help and Usage
 # ============================================================================
@@ -56,21 +64,40 @@ For more information: https://github.com/Gemutly/ArmorClaw
 """)
     sys.exit(0)
 
-# Check for --help flag before any validation
-if '--help' in sys.argv or '-h' in sys.argv:
-    show_help()
-
-# Check for --version flag
-if '--version' in sys.argv or '-v' in sys.argv:
-    print("ArmorClaw v1.0.0")
-    print("Hardened container runtime for AI agents")
-    print("Build: debian:bookworm-slim")
-    sys.exit(0)
-
 # ============================================================================
 # Secrets Loading (File Descriptor Passing)
 # ============================================================================
 
+# Provider API key environment variables
+PROVIDER_KEYS = ('OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'OPENROUTER_API_KEY',
+                 'GOOGLE_API_KEY', 'GEMINI_API_KEY', 'XAI_API_KEY')
+
+# Startup report: provider label and the variables that provide its key
+PROVIDER_LABELS = (
+    ('OpenAI', ('OPENAI_API_KEY',)),
+    ('Anthropic', ('ANTHROPIC_API_KEY',)),
+    ('OpenRouter', ('OPENROUTER_API_KEY',)),
+    ('Google/Gemini', ('GOOGLE_API_KEY', 'GEMINI_API_KEY')),
+    ('xAI', ('XAI_API_KEY',)),
+)
+
+# Map provider to environment variable name
+PROVIDER_ENV_MAP = {
+    'openai': 'OPENAI_API_KEY',
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'openrouter': 'OPENROUTER_API_KEY',
+    'google': 'GOOGLE_API_KEY',
+    'gemini': 'GEMINI_API_KEY',
+    'xai': 'XAI_API_KEY',
+    'slack': 'SLACK_BOT_TOKEN',
+    'discord': 'DISCORD_BOT_TOKEN',
+    'teams': 'MICROSOFT_API_KEY',
+    'whatsapp': 'WHATSAPP_API_KEY',
+}
+
+# Upper bound on the secrets message; the payload is a small JSON object
+MAX_SECRETS_MESSAGE_SIZE = 1024 * 1024
+
 def load_secrets_from_socket() -> dict:
     """
     Load secrets from Unix domain socket (P0-CRIT-3).
@@ -86,10 +113,6 @@ def load_secrets_from_socket() -> dict:
     max_retries = int(os.getenv('ARMORCLAW_SOCKET_RETRIES', '3'))
     retry_delay = 2  # seconds between retries
 
-    if not os.path.exists(secret_socket_path):
-        # Socket doesn't exist, skip to file-based fallback
-        return None
-
     # Retry logic for socket connection (bridge may not be ready yet)
     last_error = None
     for attempt in range(1, max_retries + 1):
@@ -111,34 +134,46 @@ def load_secrets_from_socket() -> dict:
                 length_data += chunk
 
             # Parse length
-            msg_length = (length_data[0] << 24) | (length_data[1] << 16) | (length_data[2] << 8) | length_data[3]
+            msg_length = int.from_bytes(length_data, 'big')
 
-            # Read secrets data
-            secrets_data = b''
-            while len(secrets_data) < msg_length:
-                chunk = sock.recv(min(4096, msg_length - len(secrets_data)))
-                if not chunk:
+            if msg_length > MAX_SECRETS_MESSAGE_SIZE:
+                print(f"[ArmorClaw] ✗ ERROR: Secrets message too large ({msg_length} bytes)", file=sys.stderr)
+                sock.close()
+                return None
+
+            # Read secrets data straight into a buffer sized from the length
+            # prefix. MSG_WAITALL asks the kernel for the whole remainder, but
+            # a socket with a timeout is non-blocking underneath, so short
+            # reads are still possible and the loop stays.
+            secrets_data = bytearray(msg_length)
+            view = memoryview(secrets_data)
+            received = 0
+            while received < msg_length:
+                n = sock.recv_into(view[received:], 0, socket.MSG_WAITALL)
+                if not n:
                     print(f"[ArmorClaw] ✗ ERROR: Failed to read secrets data from socket", file=sys.stderr)
                     sock.close()
                     return None
-                secrets_data += chunk
+                received += n
 
             sock.close()
 
             # Parse JSON
-            secrets = json.loads(secrets_data.decode('utf-8'))
+            secrets = _json_loads(secrets_data)
 
-            # Validate structure
-            if not secrets.get('provider') or not secrets.get('token'):
+            # Validate structure. json.loads already rejects trailing data;
+            # a non-object payload is malformed, not a reason to retry.
+            if not isinstance(secrets, dict) or not secrets.get('provider') or not secrets.get('token'):
                 print(f"[ArmorClaw] ✗ ERROR: Invalid secrets structure from socket", file=sys.stderr)
                 return None
 
             print(f"[ArmorClaw] ✓ Secrets loaded from socket (P0-CRIT-3: memory-only)")
             return secrets
 
-        except FileNotFoundError as e:
-            last_error = e
-            print(f"[ArmorClaw] ⚠️ Socket not found (attempt {attempt}/{max_retries}): {e}", file=sys.stderr)
+        except FileNotFoundError:
+            # Socket doesn't exist, skip to file-based fallback. connect()
+            # reports this directly, so there is no separate exists() check.
+            return None
         except socket.timeout as e:
             last_error = e
             print(f"[ArmorClaw] ⚠️ Timeout (attempt {attempt}/{max_retries}), retrying...", file=sys.stderr)
@@ -182,7 +217,7 @@ def validate_secrets(secrets: dict) -> bool:
     if not secrets:
         return False
 
-    required_fields = ['provider', 'token']
+    required_fields = ('provider', 'token')
     for field in required_fields:
         if field not in secrets:
             print(f"[ArmorClaw] ✗ ERROR: Missing required field in secrets: {field}", file=sys.stderr)
@@ -193,6 +228,13 @@ def validate_secrets(secrets: dict) -> bool:
         print(f"[ArmorClaw] ✗ ERROR: Token is empty", file=sys.stderr)
         return False
 
+    # Provider API keys are ASCII; anything else would only fail later in
+    # an HTTP Authorization header
+    token = secrets['token']
+    if not isinstance(token, str) or not token.isascii():
+        print(f"[ArmorClaw] ✗ ERROR: Token is not an ASCII string", file=sys.stderr)
+        return False
+
     return True
 
 def load_secrets_from_bridge() -> dict:
@@ -215,8 +257,8 @@ def load_secrets_from_bridge() -> dict:
     if os.path.isfile(secrets_path):
         try:
             print(f"[ArmorClaw] Loading secrets from {secrets_path}")
-            with open(secrets_path, 'r') as f:
-                secrets = json.load(f)
+            with open(secrets_path, 'rb') as f:
+                secrets = _json_loads(f.read())
 
             # Validate secrets structure
             if not validate_secrets(secrets):
@@ -236,10 +278,9 @@ def load_secrets_from_bridge() -> dict:
 
     # If no secrets from file, try environment variables (for testing)
     if not secrets:
-        env_vars = ['OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'OPENROUTER_API_KEY',
-                    'GOOGLE_API_KEY', 'GEMINI_API_KEY', 'XAI_API_KEY']
-        for var in env_vars:
-            if os.getenv(var):
+        env = os.environ
+        for var in PROVIDER_KEYS:
+            if env.get(var):
                 print(f"[ArmorClaw] ⚠ Using environment variable {var} (testing mode)")
                 # Don't return secrets from env vars - just note they exist
                 break
@@ -262,21 +303,7 @@ def apply_secrets(secrets: dict) -> bool:
     provider = secrets.get('provider', 'unknown').lower()
     token = secrets['token']
 
-    # Map provider to environment variable name
-    provider_env_map = {
-        'openai': 'OPENAI_API_KEY',
-        'anthropic': 'ANTHROPIC_API_KEY',
-        'openrouter': 'OPENROUTER_API_KEY',
-        'google': 'GOOGLE_API_KEY',
-        'gemini': 'GEMINI_API_KEY',
-        'xai': 'XAI_API_KEY',
-        'slack': 'SLACK_BOT_TOKEN',
-        'discord': 'DISCORD_BOT_TOKEN',
-        'teams': 'MICROSOFT_API_KEY',
-        'whatsapp': 'WHATSAPP_API_KEY',
-    }
-
-    env_var = provider_env_map.get(provider)
+    env_var = PROVIDER_ENV_MAP.get(provider)
     if env_var:
         os.environ[env_var] = token
         os.environ['ARMORCLAW_PROVIDER'] = provider  # Set provider for agent
@@ -286,53 +313,14 @@ def apply_secrets(secrets: dict) -> bool:
         print(f"[ArmorClaw] ⚠ Unknown provider: {provider}", file=sys.stderr)
         return False
 
-# ============================================================================
-# Secrets Verification (Fail-Fast)
-# ============================================================================
-
-# Try to load secrets from bridge first
-bridge_secrets = load_secrets_from_bridge()
-if bridge_secrets:
-    apply_secrets(bridge_secrets)
-
-# Check for API keys (either from bridge or environment)
-secrets_present = False
-
-if os.getenv('OPENAI_API_KEY'):
-    print("[ArmorClaw] ✓ OpenAI API key present")
-    secrets_present = True
-
-if os.getenv('ANTHROPIC_API_KEY'):
-    print("[ArmorClaw] ✓ Anthropic API key present")
-    secrets_present = True
-
-if os.getenv('OPENROUTER_API_KEY'):
-    print("[ArmorClaw] ✓ OpenRouter API key present")
-    secrets_present = True
-
-if os.getenv('GOOGLE_API_KEY') or os.getenv('GEMINI_API_KEY'):
-    print("[ArmorClaw] ✓ Google/Gemini API key present")
-    secrets_present = True
-
-if os.getenv('XAI_API_KEY'):
-    print("[ArmorClaw] ✓ xAI API key present")
-    secrets_present = True
-
-# Fail if no secrets detected
-if not secrets_present:
-    print("[ArmorClaw] ✗ ERROR: No API keys detected", file=sys.stderr)
-    print("[ArmorClaw] Container cannot start without credentials", file=sys.stderr)
-    print("[ArmorClaw]", file=sys.stderr)
-    print("[ArmorClaw] To inject secrets, start container via bridge:", file=sys.stderr)
-    print('[ArmorClaw]   echo \'{"method":"start","params":{"key_id":"..."}}\' | socat - UNIX-CONNECT:/run/armorclaw/bridge.sock', file=sys.stderr)
-    print("[ArmorClaw]", file=sys.stderr)
-    print("[ArmorClaw] For testing only, use: docker run -e OPENAI_API_KEY=sk-... armorclaw/agent:v1", file=sys.stderr)
-    sys.exit(1)
-
 # ============================================================================
 # Egress Proxy Configuration (HTTP_PROXY)
 # ============================================================================
 
+# HTTP and HTTPS proxy variables, in both the upper and lowercase
+# spellings that different HTTP clients look for
+PROXY_ENV_VARS = ('HTTP_PROXY', 'HTTPS_PROXY', 'http_proxy', 'https_proxy')
+
 def configure_proxy() -> bool:
     """
     Configure HTTP proxy for SDTW adapter outbound requests.
@@ -353,16 +341,13 @@ def configure_proxy() -> bool:
         return False
 
     # Validate proxy URL format
-    if not http_proxy.startswith('http://') and not http_proxy.startswith('https://'):
+    if not http_proxy.startswith(('http://', 'https://')):
         print(f"[ArmorClaw] ⚠ WARNING: Invalid HTTP_PROXY format: {http_proxy}", file=sys.stderr)
         return False
 
     # Set proxy environment variables for Python HTTP clients
     # Most Python HTTP libraries (requests, urllib3, httpx) respect these
-    os.environ['HTTP_PROXY'] = http_proxy
-    os.environ['HTTPS_PROXY'] = http_proxy  # For HTTPS requests
-    os.environ['http_proxy'] = http_proxy  # Lowercase version
-    os.environ['https_proxy'] = http_proxy  # Lowercase version
+    os.environ.update(dict.fromkeys(PROXY_ENV_VARS, http_proxy))
 
     # Disable proxy for localhost connections (if any)
     os.environ['NO_PROXY'] = 'localhost,127.0.0.1'
@@ -372,56 +357,6 @@ def configure_proxy() -> bool:
 
     return True
 
-# Configure egress proxy before agent starts
-configure_proxy()
-
-# ============================================================================
-# Security: Verify Hardening (Self-Check)
-# ============================================================================
-
-# Verify we're running as non-root (UID 10001)
-try:
-    current_uid = os.getuid()
-    if current_uid != 10001:
-        print(f"[ArmorClaw] ✗ WARNING: Not running as UID 10001 (current: {current_uid})", file=sys.stderr)
-except AttributeError:
-    # Windows doesn't have os.getuid, but container is Linux
-    pass
-
-# ============================================================================
-# Secrets Hygiene (Cleanup After Agent Inherits)
-# ============================================================================
-# NOTE: We NO LONGER unset environment variables here.
-# The agent process (started via os.execv below) will inherit them.
-# Once the agent process is running, we can't clear these from /proc/self/environ
-# but that's acceptable since the container is isolated.
-
-# ============================================================================
-# Step Execution Mode (STEP_CONFIG)
-# ============================================================================
-# When the Bridge sets STEP_CONFIG (via factory.go), the container runs a
-# single step, writes result.json to the state dir, and exits — instead of
-# entering the agent's Matrix polling loop.
-step_config_str = os.getenv('STEP_CONFIG', '').strip()
-if step_config_str:
-    print("[ArmorClaw] Step execution mode detected (STEP_CONFIG present)")
-    try:
-        from openclaw.step_config import parse_step_config
-        from openclaw.step_runner import StepRunner
-
-        config = parse_step_config()
-        if config:
-            runner = StepRunner()
-            exit_code = runner.run(config)
-            print(f"[ArmorClaw] Step completed with exit code {exit_code}")
-            sys.exit(exit_code)
-        else:
-            print("[ArmorClaw] ✗ ERROR: STEP_CONFIG present but failed to parse", file=sys.stderr)
-            sys.exit(1)
-    except Exception as e:
-        print(f"[ArmorClaw] ✗ ERROR: Step execution failed: {e}", file=sys.stderr)
-        sys.exit(1)
-
 # ============================================================================
 # Health Check and Validation
 # ============================================================================
@@ -435,12 +370,11 @@ def validate_agent_startup(cmd):
         cmd: Command list to execute
 
     Returns:
-        tuple: (is_valid, error_message)
+        tuple: (is_valid, error_message, cmd_path) where cmd_path is the
+        resolved executable (None when validation fails)
     """
-    import shutil
-
     if not cmd or not cmd[0]:
-        return False, "Empty command specified"
+        return False, "Empty command specified", None
 
     # Check if command exists
     cmd_path = shutil.which(cmd[0])
@@ -448,22 +382,22 @@ def validate_agent_startup(cmd):
         # Provide helpful error message
         print(f"[ArmorClaw] ✗ ERROR: Command not found: {cmd[0]}", file=sys.stderr)
         print(f"[ArmorClaw] Searched in PATH: {os.environ.get('PATH', '')}", file=sys.stderr)
-        return False, f"Command '{cmd[0]}' not found in PATH"
+        return False, f"Command '{cmd[0]}' not found in PATH", None
 
     # Check if command is executable
     if not os.access(cmd_path, os.X_OK):
-        return False, f"Command '{cmd[0]}' is not executable"
+        return False, f"Command '{cmd[0]}' is not executable", None
 
     # For Python commands, verify Python is available
     # Note: Skip subprocess version check in hardened environment where /usr/bin/env
     # may not be executable. shutil.which() already confirmed Python exists.
-    if cmd[0] in ['python', 'python3', 'python3.11']:
+    if cmd[0] in ('python', 'python3', 'python3.11'):
         # Verify we can access the Python binary directly
         if not os.access(cmd_path, os.R_OK):
-            return False, f"{cmd[0]} is not readable"
+            return False, f"{cmd[0]} is not readable", None
         # Skip version check to avoid /usr/bin/env dependency
 
-    return True, None
+    return True, None, cmd_path
 
 def check_agent_readiness():
     """
@@ -474,96 +408,184 @@ def check_agent_readiness():
         bool: True if environment is ready
     """
     # Check for required environment variables
-    required_vars = []
-    for var in ['OPENAI_API_KEY', 'ANTHROPIC_API_KEY', 'OPENROUTER_API_KEY',
-                'GOOGLE_API_KEY', 'GEMINI_API_KEY', 'XAI_API_KEY']:
-        if os.getenv(var):
-            required_vars.append(var)
-
-    if not required_vars:
+    env = os.environ
+    if not any(env.get(var) for var in PROVIDER_KEYS):
         print("[ArmorClaw] ⚠ WARNING: No API keys detected - agent may fail", file=sys.stderr)
 
     # Check available memory (basic sanity check)
     try:
+        kb = None
         with open('/proc/meminfo', 'r') as f:
-            meminfo = f.read()
-            # Parse MemAvailable (or MemTotal if MemAvailable not present)
-            for line in meminfo.split('\n'):
-                if line.startswith('MemAvailable:') or line.startswith('MemTotal:'):
-                    parts = line.split()
-                    if len(parts) >= 2:
-                        kb = int(parts[1])
-                        mb = kb // 1024
-                        if mb < 128:  # Less than 128MB available
-                            print(f"[ArmorClaw] ⚠ WARNING: Low memory available ({mb}MB)", file=sys.stderr)
-                        break
+            # Use MemAvailable (or MemTotal if MemAvailable not present).
+            # MemTotal is the first line and MemAvailable the third, so
+            # stop reading as soon as MemAvailable turns up.
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    kb = int(line.split()[1])
+                    break
+                if line.startswith('MemTotal:'):
+                    kb = int(line.split()[1])
+        if kb is not None:
+            mb = kb // 1024
+            if mb < 128:  # Less than 128MB available
+                print(f"[ArmorClaw] ⚠ WARNING: Low memory available ({mb}MB)", file=sys.stderr)
     except (FileNotFoundError, ValueError, IndexError):
         pass  # Meminfo not available (non-Linux or read error)
 
     return True
 
 # ============================================================================
-# Start OpenClaw Agent
+# Main
 # ============================================================================
 
-print("[ArmorClaw] Starting OpenClaw agent...")
-
-# Get the command to run from CMD or use default
-if len(sys.argv) > 1:
-    cmd = sys.argv[1:]
-else:
-    # Default: start ArmorClaw agent (direct Python import)
-    cmd = ['python', '-c', 'from openclaw import main; main()']
-
-# Pre-flight validation
-print(f"[ArmorClaw] Validating agent startup: {' '.join(cmd[:2])}...")
-is_valid, error_msg = validate_agent_startup(cmd)
-if not is_valid:
-    print(f"[ArmorClaw] ✗ ERROR: Agent validation failed: {error_msg}", file=sys.stderr)
-    print(f"[ArmorClaw] Container cannot start without the agent", file=sys.stderr)
-    print(f"[ArmorClaw]", file=sys.stderr)
-    print(f"[ArmorClaw] This may indicate:", file=sys.stderr)
-    print(f"[ArmorClaw]   1. The agent module is not installed", file=sys.stderr)
-    print(f"[ArmorClaw]   2. The container image is incomplete", file=sys.stderr)
-    print(f"[ArmorClaw]   3. A build or installation issue", file=sys.stderr)
-    print(f"[ArmorClaw]", file=sys.stderr)
-    print(f"[ArmorClaw] For testing, you can override the command:", file=sys.stderr)
-    print(f'[ArmorClaw]   docker run --rm -e OPENAI_API_KEY=sk-... {cmd[0]} <your-command>', file=sys.stderr)
-    sys.exit(127)  # 127 = command not found
-
-# Check environment readiness
-if not check_agent_readiness():
-    print("[ArmorClaw] ⚠ WARNING: Environment checks failed", file=sys.stderr)
-    print("[ArmorClaw] Agent may not function correctly", file=sys.stderr)
-
-print("[ArmorClaw] ✓ Agent validation passed, starting...")
-
-# Use exec to replace Python with agent process (PID 1)
-# This ensures signals are handled correctly and environment is inherited
-# Note: os.execv does not return on success - the current process is replaced
-# Timeout handling is the responsibility of the container orchestrator (Docker)
-try:
-    # Try to find the command (already validated above)
-    import shutil
-    cmd_path = shutil.which(cmd[0])
-    if cmd_path:
-        # Set whitelist flag to allow security hook to pass this execve call
-        os.environ['ARMORCLAW_ALLOW_EXEC'] = '1'
-        os.execv(cmd_path, cmd)
+def main():
+    """Verify secrets and environment, then exec the agent or run a step."""
+    # Check for --help flag before any validation
+    if '--help' in sys.argv or '-h' in sys.argv:
+        show_help()
+
+    # Check for --version flag
+    if '--version' in sys.argv or '-v' in sys.argv:
+        print("ArmorClaw v1.0.0")
+        print("Hardened container runtime for AI agents")
+        print("Build: debian:bookworm-slim")
+        sys.exit(0)
+
+    # Secrets Verification (Fail-Fast)
+    # Try to load secrets from bridge first
+    bridge_secrets = load_secrets_from_bridge()
+    if bridge_secrets:
+        apply_secrets(bridge_secrets)
+
+    # Check for API keys (either from bridge or environment)
+    secrets_present = False
+
+    env = os.environ
+    for label, env_vars in PROVIDER_LABELS:
+        if any(env.get(var) for var in env_vars):
+            print(f"[ArmorClaw] ✓ {label} API key present")
+            secrets_present = True
+
+    # Fail if no secrets detected
+    if not secrets_present:
+        sys.stderr.write("\n".join([
+            "[ArmorClaw] ✗ ERROR: No API keys detected",
+            "[ArmorClaw] Container cannot start without credentials",
+            "[ArmorClaw]",
+            "[ArmorClaw] To inject secrets, start container via bridge:",
+            '[ArmorClaw]   echo \'{"method":"start","params":{"key_id":"..."}}\' | socat - UNIX-CONNECT:/run/armorclaw/bridge.sock',
+            "[ArmorClaw]",
+            "[ArmorClaw] For testing only, use: docker run -e OPENAI_API_KEY=sk-... armorclaw/agent:v1",
+        ]) + "\n")
+        sys.exit(1)
+
+    # Configure egress proxy before agent starts
+    configure_proxy()
+
+    # Security: Verify Hardening (Self-Check)
+    # Verify we're running as non-root (UID 10001)
+    try:
+        current_uid = os.getuid()
+        if current_uid != 10001:
+            print(f"[ArmorClaw] ✗ WARNING: Not running as UID 10001 (current: {current_uid})", file=sys.stderr)
+    except AttributeError:
+        # Windows doesn't have os.getuid, but container is Linux
+        pass
+
+    # Secrets Hygiene (Cleanup After Agent Inherits)
+    # NOTE: We NO LONGER unset environment variables here.
+    # The agent process (started via os.execv below) will inherit them.
+    # Once the agent process is running, we can't clear these from /proc/self/environ
+    # but that's acceptable since the container is isolated.
+
+    # Step Execution Mode (STEP_CONFIG)
+    # When the Bridge sets STEP_CONFIG (via factory.go), the container runs a
+    # single step, writes result.json to the state dir, and exits — instead of
+    # entering the agent's Matrix polling loop.
+    step_config_str = os.getenv('STEP_CONFIG', '').strip()
+    if step_config_str:
+        print("[ArmorClaw] Step execution mode detected (STEP_CONFIG present)")
+        try:
+            from openclaw.step_config import parse_step_config
+            from openclaw.step_runner import StepRunner
+
+            config = parse_step_config()
+            if config:
+                runner = StepRunner()
+                exit_code = runner.run(config)
+                print(f"[ArmorClaw] Step completed with exit code {exit_code}")
+                sys.exit(exit_code)
+            else:
+                print("[ArmorClaw] ✗ ERROR: STEP_CONFIG present but failed to parse", file=sys.stderr)
+                sys.exit(1)
+        except Exception as e:
+            print(f"[ArmorClaw] ✗ ERROR: Step execution failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    # Start OpenClaw Agent
+    print("[ArmorClaw] Starting OpenClaw agent...")
+
+    # Get the command to run from CMD or use default
+    if len(sys.argv) > 1:
+        cmd = sys.argv[1:]
     else:
-        # Command not found, try execvp as fallback
+        # Default: start ArmorClaw agent (direct Python import)
+        cmd = ['python', '-c', 'from openclaw import main; main()']
+
+    # Pre-flight validation
+    print(f"[ArmorClaw] Validating agent startup: {' '.join(cmd[:2])}...")
+    is_valid, error_msg, cmd_path = validate_agent_startup(cmd)
+    if not is_valid:
+        sys.stderr.write("\n".join([
+            f"[ArmorClaw] ✗ ERROR: Agent validation failed: {error_msg}",
+            "[ArmorClaw] Container cannot start without the agent",
+            "[ArmorClaw]",
+            "[ArmorClaw] This may indicate:",
+            "[ArmorClaw]   1. The agent module is not installed",
+            "[ArmorClaw]   2. The container image is incomplete",
+            "[ArmorClaw]   3. A build or installation issue",
+            "[ArmorClaw]",
+            "[ArmorClaw] For testing, you can override the command:",
+            f"[ArmorClaw]   docker run --rm -e OPENAI_API_KEY=sk-... {cmd[0]} <your-command>",
+        ]) + "\n")
+        sys.exit(127)  # 127 = command not found
+
+    # Check environment readiness
+    if not check_agent_readiness():
+        print("[ArmorClaw] ⚠ WARNING: Environment checks failed", file=sys.stderr)
+        print("[ArmorClaw] Agent may not function correctly", file=sys.stderr)
+
+    print("[ArmorClaw] ✓ Agent validation passed, starting...")
+
+    # Use exec to replace Python with agent process (PID 1)
+    # This ensures signals are handled correctly and environment is inherited
+    # Note: os.execv does not return on success - the current process is replaced
+    # Timeout handling is the responsibility of the container orchestrator (Docker)
+    try:
+        # Set whitelist flag to allow security hook to pass this execve call.
+        # The LD_PRELOAD hook checks getenv() in *this* process, so the flag has
+        # to be in os.environ; passing it only in an execve() env would not do.
         os.environ['ARMORCLAW_ALLOW_EXEC'] = '1'
-        os.execvp(cmd[0], cmd)
-except (FileNotFoundError, OSError) as e:
-    # This should not happen after validation, but handle it anyway
-    print(f"[ArmorClaw] ✗ ERROR: Unexpected error during exec: {e}", file=sys.stderr)
-    print(f"[ArmorClaw] Command: {' '.join(cmd)}", file=sys.stderr)
-    sys.exit(1)
-except Exception as e:
-    # Catch-all for any other errors
-    print(f"[ArmorClaw] ✗ ERROR: Failed to start agent: {e}", file=sys.stderr)
+
+        # cmd_path was resolved by validate_agent_startup above
+        if cmd_path:
+            os.execv(cmd_path, cmd)
+        else:
+            # Command not found, try execvp as fallback
+            os.execvp(cmd[0], cmd)
+    except (FileNotFoundError, OSError) as e:
+        # This should not happen after validation, but handle it anyway
+        print(f"[ArmorClaw] ✗ ERROR: Unexpected error during exec: {e}", file=sys.stderr)
+        print(f"[ArmorClaw] Command: {' '.join(cmd)}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        # Catch-all for any other errors
+        print(f"[ArmorClaw] ✗ ERROR: Failed to start agent: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    # This line should never be reached due to exec
+    print("[ArmorClaw] ✗ ERROR: exec returned unexpectedly", file=sys.stderr)
     sys.exit(1)
 
-# This line should never be reached due to exec
-print("[ArmorClaw] ✗ ERROR: exec returned unexpectedly", file=sys.stderr)
-sys.exit(1)
+if __name__ == '__main__':
+    main()
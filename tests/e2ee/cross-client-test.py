@@ -13,13 +13,33 @@ Usage:
 """
 
 import argparse
+import functools
 import json
 import requests
+import threading
 import time
+import uuid
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
+# orjson, when installed, parses response bodies straight from bytes
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+
+@functools.lru_cache(maxsize=1)
+def _server_versions(server_url: str) -> dict:
+    """Fetch /_matrix/client/versions once per process"""
+    response = requests.get(f"{server_url}/_matrix/client/versions", timeout=2)
+    assert response.status_code == 200, f"Server not reachable: {response.status_code}"
+    return _loads(response.content)
+
+
 @dataclass
 class TestResult:
     name: str
@@ -27,18 +47,48 @@ class TestResult:
     message: str
     duration_ms: float
 
+
 class MatrixTestClient:
     """Simple Matrix client for testing"""
 
-    def __init__(self, server_url: str):
+    def __init__(self, server_url: str, adapter: Optional[HTTPAdapter] = None):
         self.server_url = server_url.rstrip('/')
+        # Sessions are not thread-safe, so every client has its own and a
+        # client must only be used by one thread at a time. Shared test users
+        # get a fresh client per caller (see E2EETestSuite.get_user). Clients
+        # may still share one adapter, and with it the connection pool.
+        self.session = requests.Session()
+        self._owns_adapter = adapter is None
+        if adapter is not None:
+            self.session.mount("http://", adapter)
+            self.session.mount("https://", adapter)
+        self._auth_headers: dict[str, str] = {}
         self.access_token: Optional[str] = None
         self.user_id: Optional[str] = None
         self.device_id: Optional[str] = None
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the session's pooled connections, unless they are shared"""
+        # Session.close() closes the mounted adapters too
+        if self._owns_adapter:
+            self.session.close()
+
+    def _set_credentials(self, data: dict):
+        """Store the login response and authorize subsequent requests"""
+        self.access_token = data.get("access_token")
+        self.user_id = data.get("user_id")
+        self.device_id = data.get("device_id")
+        self._auth_headers = {"Authorization": f"Bearer {self.access_token}"}
+
     def register(self, username: str, password: str) -> dict:
         """Register a new user"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/_matrix/client/v3/register",
             json={
                 "username": username,
@@ -50,7 +100,7 @@ class MatrixTestClient:
 
         if response.status_code == 401:
             # Need to complete UIA
-            response = requests.post(
+            response = self.session.post(
                 f"{self.server_url}/_matrix/client/v3/register",
                 json={
                     "username": username,
@@ -61,18 +111,16 @@ class MatrixTestClient:
                 }
             )
 
-        data = response.json()
+        data = _loads(response.content)
         if response.status_code != 200:
             raise Exception(f"Registration failed: {data}")
 
-        self.access_token = data.get("access_token")
-        self.user_id = data.get("user_id")
-        self.device_id = data.get("device_id")
+        self._set_credentials(data)
         return data
 
     def login(self, username: str, password: str) -> dict:
         """Login as existing user"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/_matrix/client/v3/login",
             json={
                 "type": "m.login.password",
@@ -82,20 +130,18 @@ class MatrixTestClient:
             }
         )
 
-        data = response.json()
+        data = _loads(response.content)
         if response.status_code != 200:
             raise Exception(f"Login failed: {data}")
 
-        self.access_token = data.get("access_token")
-        self.user_id = data.get("user_id")
-        self.device_id = data.get("device_id")
+        self._set_credentials(data)
         return data
 
     def create_room(self, name: str = "Test Room") -> str:
         """Create a new room"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/_matrix/client/v3/createRoom",
-            headers={"Authorization": f"Bearer {self.access_token}"},
+            headers=self._auth_headers,
             json={
                 "name": name,
                 "preset": "private_chat",
@@ -103,7 +149,7 @@ class MatrixTestClient:
             }
         )
 
-        data = response.json()
+        data = _loads(response.content)
         if response.status_code != 200:
             raise Exception(f"Create room failed: {data}")
 
@@ -111,31 +157,38 @@ class MatrixTestClient:
 
     def send_message(self, room_id: str, body: str) -> str:
         """Send a text message"""
-        txn_id = f"txn_{int(time.time() * 1000)}"
-        response = requests.put(
+        txn_id = f"txn_{time.monotonic_ns()}"
+        response = self.session.put(
             f"{self.server_url}/_matrix/client/v3/rooms/{room_id}/send/m.room.message/{txn_id}",
-            headers={"Authorization": f"Bearer {self.access_token}"},
+            headers=self._auth_headers,
             json={
                 "msgtype": "m.text",
                 "body": body
             }
         )
 
-        data = response.json()
+        data = _loads(response.content)
         if response.status_code != 200:
             raise Exception(f"Send message failed: {data}")
 
         return data["event_id"]
 
-    def get_messages(self, room_id: str, limit: int = 10) -> list:
-        """Get messages from a room"""
-        response = requests.get(
+    def get_messages(self, room_id: str, limit: int = 10,
+                     event_types: Optional[list[str]] = None) -> list:
+        """Get messages from a room, optionally only events of the given types"""
+        params = {"limit": limit, "dir": "b"}
+        if event_types:
+            # RoomEventFilter: the server drops other events (membership,
+            # room state) before applying the limit
+            params["filter"] = json.dumps({"types": event_types})
+
+        response = self.session.get(
             f"{self.server_url}/_matrix/client/v3/rooms/{room_id}/messages",
-            headers={"Authorization": f"Bearer {self.access_token}"},
-            params={"limit": limit, "dir": "b"}
+            headers=self._auth_headers,
+            params=params
         )
 
-        data = response.json()
+        data = _loads(response.content)
         if response.status_code != 200:
             raise Exception(f"Get messages failed: {data}")
 
@@ -143,23 +196,23 @@ class MatrixTestClient:
 
     def invite_user(self, room_id: str, user_id: str) -> dict:
         """Invite a user to a room"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/_matrix/client/v3/rooms/{room_id}/invite",
-            headers={"Authorization": f"Bearer {self.access_token}"},
+            headers=self._auth_headers,
             json={"user_id": user_id}
         )
 
-        return response.json()
+        return _loads(response.content)
 
     def join_room(self, room_id: str) -> dict:
         """Join a room"""
-        response = requests.post(
+        response = self.session.post(
             f"{self.server_url}/_matrix/client/v3/rooms/{room_id}/join",
-            headers={"Authorization": f"Bearer {self.access_token}"},
+            headers=self._auth_headers,
             json={}
         )
 
-        return response.json()
+        return _loads(response.content)
 
 
 class E2EETestSuite:
@@ -168,6 +221,32 @@ class E2EETestSuite:
     def __init__(self, server_url: str):
         self.server_url = server_url
         self.results: list[TestResult] = []
+        # All clients share one connection pool to the server
+        self.adapter = HTTPAdapter()
+        # Tests may run on worker threads; serialize result bookkeeping
+        self._results_lock = threading.Lock()
+        # Credentials of registered users shared by the tests that only need
+        # an account
+        self._users: dict[str, dict] = {}
+        # One lock per user, so different users can register concurrently
+        self._user_locks: dict[str, threading.Lock] = {}
+        self._users_lock = threading.Lock()
+
+    def get_user(self, name: str) -> MatrixTestClient:
+        """Return a new client for a shared user, registering it on first use"""
+        with self._users_lock:
+            user_lock = self._user_locks.setdefault(name, threading.Lock())
+        client = MatrixTestClient(self.server_url, adapter=self.adapter)
+        with user_lock:
+            credentials = self._users.get(name)
+            if credentials is None:
+                data = client.register(f"{name}_{uuid.uuid4().hex[:12]}", "test_password")
+                credentials = self._users[name] = {
+                    key: data.get(key) for key in ("access_token", "user_id", "device_id")
+                }
+        # Only the credentials are shared; each caller gets its own session
+        client._set_credentials(credentials)
+        return client
 
     def run_test(self, name: str, test_func) -> TestResult:
         """Run a single test"""
@@ -188,44 +267,41 @@ class E2EETestSuite:
                 duration_ms=(time.time() - start_time) * 1000
             )
 
-        self.results.append(result)
-        status = "✓" if result.passed else "✗"
-        print(f"  {status} {name} ({result.duration_ms:.0f}ms)")
-        if not result.passed:
-            print(f"    Error: {result.message}")
+        with self._results_lock:
+            self.results.append(result)
+            status = "✓" if result.passed else "✗"
+            print(f"  {status} {name} ({result.duration_ms:.0f}ms)")
+            if not result.passed:
+                print(f"    Error: {result.message}")
         return result
 
     def test_server_connectivity(self):
         """Test that Matrix server is reachable"""
-        response = requests.get(f"{self.server_url}/_matrix/client/versions")
-        assert response.status_code == 200, f"Server not reachable: {response.status_code}"
-        data = response.json()
+        data = _server_versions(self.server_url)
         assert "versions" in data, "Invalid server response"
 
     def test_user_registration(self):
         """Test user registration"""
-        client = MatrixTestClient(self.server_url)
-        result = client.register(f"test_user_{int(time.time())}", "test_password_123")
+        client = MatrixTestClient(self.server_url, adapter=self.adapter)
+        result = client.register(f"test_user_{uuid.uuid4().hex[:12]}", "test_password_123")
         assert "access_token" in result, "No access token in registration response"
         assert "user_id" in result, "No user_id in registration response"
 
     def test_room_creation(self):
         """Test room creation"""
-        client = MatrixTestClient(self.server_url)
-        client.register(f"room_test_{int(time.time())}", "test_password")
+        client = self.get_user("user1")
         room_id = client.create_room("Test Room")
         assert room_id.startswith("!"), f"Invalid room ID: {room_id}"
 
     def test_message_send_receive(self):
         """Test message send and receive"""
-        client = MatrixTestClient(self.server_url)
-        client.register(f"msg_test_{int(time.time())}", "test_password")
+        client = self.get_user("user1")
         room_id = client.create_room("Message Test Room")
 
         test_message = f"Test message at {time.time()}"
         event_id = client.send_message(room_id, test_message)
 
-        messages = client.get_messages(room_id)
+        messages = client.get_messages(room_id, event_types=["m.room.message"])
         assert len(messages) > 0, "No messages found"
 
         found = any(
@@ -236,14 +312,12 @@ class E2EETestSuite:
 
     def test_two_user_message_flow(self):
         """Test message flow between two users"""
-        # User 1 creates room and sends message
-        client1 = MatrixTestClient(self.server_url)
-        client1.register(f"user1_{int(time.time())}", "password1")
-        room_id = client1.create_room("Two User Test")
+        # Both users are independent until the room exists
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            client1, client2 = executor.map(self.get_user, ("user1", "user2"))
 
-        # User 2 registers and joins
-        client2 = MatrixTestClient(self.server_url)
-        client2.register(f"user2_{int(time.time())}", "password2")
+        # User 1 creates room, user 2 joins
+        room_id = client1.create_room("Two User Test")
         client1.invite_user(room_id, client2.user_id)
         client2.join_room(room_id)
 
@@ -252,7 +326,7 @@ class E2EETestSuite:
         client2.send_message(room_id, test_message)
 
         # User 1 receives message
-        messages = client1.get_messages(room_id)
+        messages = client1.get_messages(room_id, event_types=["m.room.message"])
         found = any(
             m.get("content", {}).get("body") == test_message
             for m in messages
@@ -268,10 +342,20 @@ class E2EETestSuite:
         print("\nRunning tests...\n")
 
         self.run_test("Server Connectivity", self.test_server_connectivity)
-        self.run_test("User Registration", self.test_user_registration)
-        self.run_test("Room Creation", self.test_room_creation)
-        self.run_test("Message Send/Receive", self.test_message_send_receive)
-        self.run_test("Two User Message Flow", self.test_two_user_message_flow)
+
+        # The remaining tests each work in their own room, so they are
+        # independent and can overlap their requests to the server
+        independent_tests = [
+            ("User Registration", self.test_user_registration),
+            ("Room Creation", self.test_room_creation),
+            ("Message Send/Receive", self.test_message_send_receive),
+            ("Two User Message Flow", self.test_two_user_message_flow),
+        ]
+        with ThreadPoolExecutor(max_workers=len(independent_tests)) as executor:
+            for name, test_func in independent_tests:
+                executor.submit(self.run_test, name, test_func)
+
+        self.adapter.close()
 
         print("\n" + "-"*60)
         passed = sum(1 for r in self.results if r.passed)
@@ -81,7 +81,7 @@ fi
 
 # Test 9: Verify message framing (4-byte length prefix)
 echo "Test 9: Checking message framing implementation..."
-if grep -q 'length_data\[0\] << 24' "container/opt/openclaw/entrypoint.py"; then
+if grep -q "int.from_bytes(length_data, 'big')" "container/opt/openclaw/entrypoint.py"; then
     echo "✓ Message framing implemented (big-endian length prefix)"
 else
     echo "✗ FAIL: Message framing not found"